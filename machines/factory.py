@@ -156,6 +156,14 @@ class Factory:
     @property
     def tasks(self):
         """return list tasks"""
+        return self.snapshot_tasks()
+
+    def snapshot_tasks(self):
+        """return immutable snapshot of the task list
+
+        Not locked: copying the deque is atomic, and the factory lock is held
+        while running callbacks (which may read the tasks).
+        """
         return tuple(self._tasklist)
 
     def reset_queue(self):
@@ -178,7 +186,7 @@ class Factory:
 
     def add_task(self, task, temp=False):
         """add task to queue"""
-        LOGGER.info("Adding task to queue: %s" % str(task))
+        LOGGER.info("Adding task to queue: %s", task)
 
         # check target
         self.check(task.output)
@@ -187,10 +195,9 @@ class Factory:
         try:
             with self.lock:
                 self.queue.put(task)
+                self._tasklist.append(task)
         except self.queue.Duplicate:
             pass
-        else:
-            self._tasklist.append(task)
         # start processing (if necessary)
         self.serve()
 
@@ -205,7 +212,11 @@ class Factory:
     def write(self, target, data, mode=None):
         """write target data into storage"""
         storage = self.get_storage(target)
-        storage.write(target, data, mode=mode)
+        if mode is None:
+            # fast path for new targets
+            storage.write_new(target, data)
+        else:
+            storage.write(target, data, mode=mode)
 
     def check(self, target):
         """test target"""
@@ -236,7 +247,7 @@ class Factory:
 
     def callback(self, summary):
         """run callback"""
-        LOGGER.debug("Running callback for factory: %s" % self)
+        LOGGER.debug("Running callback for factory: %s", self)
         if self._callback:
             self._callback(summary)
 
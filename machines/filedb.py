@@ -22,6 +22,9 @@ LOGGER = logging.getLogger(__name__)
 class FileDB:
     """dict-like object to/from file mapping"""
 
+    # reading while writing may access incomplete files
+    supports_concurrent_read = False
+
     def __init__(
         self, root, converter=None, handlers=None, default_handler=None, signature=None
     ):
@@ -66,6 +69,21 @@ class FileDB:
     def __iter__(self):
         """return iterator on existing targets"""
         failed = []
+        for path, target in self._parse_leaves():
+            if target is None:
+                failed.append(path)
+                continue
+            yield target
+        if failed:
+            LOGGER.warn(f"Failed to parse {len(failed)} targets in '{self.root}'")
+        return failed
+
+    def failed(self):
+        """return list of paths which could not be parsed into targets"""
+        return [path for path, target in self._parse_leaves() if target is None]
+
+    def _parse_leaves(self):
+        """iterate (path, target) pairs of leaf directories (target=None if invalid)"""
         for path, dirs, files in os.walk(self.root):
             path = pathlib.Path(path)
             # remove tempdirs
@@ -81,12 +99,8 @@ class FileDB:
                 # skip target
                 LOGGER.info("Skipping path %s: %s", path, exc)
                 # failed.append((path, str(exc)))
-                failed.append(path)
-                continue
-            yield target
-        if failed:
-            LOGGER.warn(f"Failed to parse {len(failed)} targets in '{self.root}'")
-        return failed
+                target = None
+            yield path, target
 
     def __bool__(self):
         """check whether storage is empty"""
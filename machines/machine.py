@@ -8,7 +8,8 @@ from .common import Identifier
 from .utils import obj_repr, indices_as_key
 from .target import Branch, Index, Identifier, Target
 from .io import Input, Output, parse_io
-from .parameters import Parameter, VariableIO, Freeze, setup_parameter, solve_parameters
+from .parameters import Parameter, VariableIO, Freeze, setup_parameter
+from .parameters import solve_parameters, plan_parameters
 from .task import Task, MetaTask
 from .graph import DependencyGraph, get_meta_ios
 
@@ -35,6 +36,8 @@ class Machine:
         description=None,
         groups=None,
         parameters={},
+        _parsed_inputs=None,
+        _parsed_outputs=None,
         **kwargs,
     ):
         """initialize Machine object
@@ -58,6 +61,8 @@ class Machine:
                 * "branch": aggregate all branches (keep separate indices)
             parameters: dict of Parameter initializers/objects
             groups: dict of input name groups
+            _parsed_inputs, _parsed_outputs: dict of lists of Input/Output
+                (private) already parsed i/os, bypass `parse_io` (cf. `copy`)
 
         """
         # store function
@@ -79,6 +84,7 @@ class Machine:
         # parameters
         self.parameters = {}
         self.frozen_parameters = {}
+        self._plans = {}  # cache for `parameter_plan`
 
         # name and description
         self.name = func.__name__
@@ -87,19 +93,35 @@ class Machine:
         self.description = description
 
         # parse inputs / outputs
-        inputs = inputs if inputs else input
-        for name, alts in parse_io(inputs).items():
-            self.set_input(name, alts)
-
-        outputs = outputs if outputs else output
-        for name, alts in parse_io(outputs).items():
-            self.set_output(name, alts)
+        if _parsed_inputs is not None:
+            if not is_parsed_io(_parsed_inputs, Input):
+                raise TypeError(f"Invalid input type: {_parsed_inputs}")
+            self.inputs = {name: list(alts) for name, alts in _parsed_inputs.items()}
+        else:
+            inputs = inputs if inputs else input
+            for name, alts in parse_io(inputs).items():
+                self.set_input(name, alts)
+
+        if _parsed_outputs is not None:
+            if not is_parsed_io(_parsed_outputs, Output):
+                raise TypeError(f"Invalid output type: {_parsed_outputs}")
+            self.outputs = {name: list(alts) for name, alts in _parsed_outputs.items()}
+            if not self.multi_outputs and sum(map(len, self.outputs.values())) > 1:
+                raise ValueError(f"Multiple outputs are not authorized")
+        else:
+            outputs = outputs if outputs else output
+            for name, alts in parse_io(outputs).items():
+                self.set_output(name, alts)
 
         # parse parameters
         parameters = {**kwargs, **parameters}
         for name, parameter in parameters.items():
             self.set_parameter(name, setup_parameter(parameter))
 
+        if _parsed_inputs is not None or _parsed_outputs is not None:
+            # i/os were not checked in set_input/set_output
+            self._check_signature()
+
     def set_input(self, name, inputs, group=None, replace=False):
         """add/replace input"""
         if replace:
@@ -153,6 +175,7 @@ class Machine:
         else:
             # set parameter
             self.parameters[name] = parameter
+        self._plans.clear()
 
         # check
         self._check_signature()
@@ -186,6 +209,13 @@ class Machine:
             missing = list(parameters - signature)
             raise ValueError(f"Missing parameters(s) in function definition: {missing}")
 
+    def parameter_plan(self, attr="all_parameters"):
+        """return cached plan of parameter dict `attr` (cf. solve_parameters)"""
+        plan = self._plans.get(attr)
+        if plan is None:
+            plan = self._plans[attr] = plan_parameters(getattr(self, attr))
+        return plan
+
     @property
     def info(self):
         """return Machine info"""
@@ -327,7 +357,7 @@ class Machine:
             return [self], {}
 
         # get variable i/o parameters
-        param_values = solve_parameters(self.variable_ios, parameters)
+        param_values = solve_parameters(self.parameter_plan("variable_ios"), parameters)
 
         # variable inputs
         inputs = {}
@@ -459,10 +489,15 @@ class Machine:
         """copy machine"""
         inputs = kwargs.pop("inputs", kwargs.pop("input", self.inputs))
         outputs = kwargs.pop("outputs", kwargs.pop("output", self.outputs))
+        # skip parsing if i/os are already in parsed form
+        parsed_inputs = inputs if is_parsed_io(inputs, Input) else None
+        parsed_outputs = outputs if is_parsed_io(outputs, Output) else None
         return self.__class__(
             self.func,
             inputs=inputs,
             outputs=outputs,
+            _parsed_inputs=parsed_inputs,
+            _parsed_outputs=parsed_outputs,
             aggregate=kwargs.pop("aggregate", self.aggregate),
             requires=kwargs.pop("requires", self.requires),
             description=kwargs.pop("description", self.description),
@@ -585,7 +620,9 @@ class MetaMachine(Machine):
         """solve metamachine: return list of machines"""
 
         # metamachine parameters
-        param_values = solve_parameters(self.meta_parameters, parameters)
+        param_values = solve_parameters(
+            self.parameter_plan("meta_parameters"), parameters
+        )
 
         # get the machines: run func
         fparams = self._func_signature
@@ -669,6 +706,16 @@ def dispatch_parameters(identifiers, parameters):
     return {id: parameters for id in identifiers}
 
 
+def is_parsed_io(obj, cls):
+    """return True if obj is a dict of lists of `cls` (Input/Output, cf. `parse_io`)"""
+    if not isinstance(obj, dict):
+        return False
+    return all(
+        isinstance(alts, list) and all(isinstance(io, cls) for io in alts)
+        for alts in obj.values()
+    )
+
+
 def update_machines_ios(machines):
     """set intermediary machine i/os to temporary"""
     meta_inputs, meta_outputs = get_meta_ios(machines)
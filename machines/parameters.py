@@ -3,16 +3,19 @@
 
 import os
 import abc
+import copy
 import collections
+import functools
 import pathlib
-import json
-import yaml
 import logging
 from .io import TargetType, parse_string_io
 from .common import ParameterError
 
 LOGGER = logging.getLogger(__name__)
 
+# sentinel for missing values
+MISSING = object()
+
 
 def setup_parameter(obj=None, name=None, **kwargs):
     """helper function for creating a parameter object
@@ -34,6 +37,11 @@ def setup_parameter(obj=None, name=None, **kwargs):
     if isinstance(obj, Parameter):
         return obj
 
+    elif not kwargs and name is None and not isinstance(obj, (tuple, list, dict)):
+        if obj in BASE_LOOKUP:
+            # fast path: shared default Parameter for base types
+            return default_parameter(obj)
+
     help = kwargs.pop("help", kwargs.pop("description", None))
     default = kwargs.pop("default", ...)
 
@@ -67,6 +75,12 @@ def setup_parameter(obj=None, name=None, **kwargs):
     return Parameter(type, name=name, default=default, help=help, **kwargs)
 
 
+@functools.lru_cache(maxsize=None)
+def default_parameter(type):
+    """return default Parameter for base type (cached)"""
+    return Parameter(type)
+
+
 def setup_parameter_type(type):
     """helper function to set parameter type from simple objects
 
@@ -76,29 +90,37 @@ def setup_parameter_type(type):
     type == [value1, value2] -> Choice parameter type
 
     """
-    if isinstance(type, ParameterType):
-        # already set
+    try:
+        # fast path: base types
+        return BASE_LOOKUP[type]
+    except (KeyError, TypeError):
         pass
 
-    elif type is None:
-        type = STRING
+    if isinstance(type, ParameterType):
+        # already set
+        return type
 
     elif isinstance(type, list):
-        if all(item in BASE_TYPES for item in type):
-            # multi-type short cut
-            type = BaseType(*type)
-
-        elif not any(
-            item in BASE_TYPES or isinstance(item, ParameterType) for item in type
-        ):
-            # choice shortcut
-            type = Choice(type)
-    elif type in BASE_TYPES:
-        type = BASE_TYPES[type]
+        list_type = setup_parameter_type_from_list(tuple(type))
+        if list_type is not None:
+            return list_type
 
-    else:
-        raise ValueError(f"Invalid parameter type: {type}")
-    return type
+    raise ValueError(f"Invalid parameter type: {type}")
+
+
+@functools.lru_cache(maxsize=512)
+def setup_parameter_type_from_list(items):
+    """multi-type or Choice parameter type from tuple of types/values (cached)"""
+    if all(item in BASE_TYPES for item in items):
+        # multi-type short cut
+        return BaseType(*items)
+
+    elif not any(
+        item in BASE_TYPES or isinstance(item, ParameterType) for item in items
+    ):
+        # choice shortcut
+        return Choice(items)
+    return None
 
 
 def setup_variable_io(
@@ -115,25 +137,37 @@ def setup_variable_io(
         raise ValueError(f"Invalid value for `dest`: {dest}")
 
 
-def solve_parameters(parameters, values):
-    """replace parameter objects with their values from `values`"""
-    solved = {}
+def plan_parameters(parameters):
+    """return tuple of (name, parser) pairs for `solve_parameters`"""
+    plan = []
     for name, parameter in parameters.items():
         if not isinstance(parameter, Parameter):
             raise TypeError(f"Expected Parameter object, got: {parameter}")
 
         elif isinstance(parameter.type, Freeze):
-            # freeze
-            solved[name] = parameter.type.value
+            # freeze: the Freeze type ignores the passed value
+            plan.append((name, parameter.type))
         else:
             # parse/cast value
-            solved[name] = parameter(values.get(name, ...))
-    return solved
+            plan.append((name, parameter))
+    return tuple(plan)
+
+
+def solve_parameters(parameters, values):
+    """replace parameter objects with their values from `values`
+
+    `parameters` is a dict of Parameter objects, or the output of `plan_parameters`
+    """
+    if isinstance(parameters, dict):
+        parameters = plan_parameters(parameters)
+    return {name: parser(values.get(name, ...)) for name, parser in parameters}
 
 
 class ParameterType(abc.ABC):
     """Base class for Parameter types"""
 
+    __slots__ = ()
+
     flags = None  # return dict of flags where applicable
 
     def __call__(self, value):
@@ -147,6 +181,20 @@ class ParameterType(abc.ABC):
 class Parameter:
     """Parameter object"""
 
+    __slots__ = (
+        "type",
+        "name",
+        "none",
+        "nargs",
+        "help",
+        "default",
+        "_info",
+        "_str",
+        "_repr",
+        "_convert",
+        "_parse",
+    )
+
     @property
     def required(self):
         return self.default is Ellipsis
@@ -163,6 +211,24 @@ class Parameter:
         self.none = none or default is None
         self.nargs = nargs
         self.help = help
+        self._info = None  # cached info/str/repr
+        self._str = None
+        self._repr = None
+
+        # select parsing method once and for all
+        self._convert = self.type.convert
+        if isinstance(self.type, Freeze):
+            # frozen value: passed values are ignored
+            self._parse = self._convert
+        elif nargs is None:
+            self._parse = self._parse_scalar
+        elif nargs > 0:
+            self._parse = self._parse_fixed
+        elif nargs == -1:
+            self._parse = self._parse_variadic
+        else:
+            self._parse = self._parse_sequence
+
         if default is not Ellipsis:
             self.default = self.parse(default)
         else:
@@ -183,62 +249,108 @@ class Parameter:
                 return None
             raise ParameterError(f"Parameter `{self.name}` cannot be None")
 
-        elif self.nargs is None:
-            return self.type(value)
-
-        elif self.nargs > 0:
-            if not isinstance(value, collections.abc.Sequence):
-                raise ParameterError(
-                    f"Expected {self.nargs} values for parameter {self.name}"
-                )
-            elif len(value) != self.nargs:
-                raise ParameterError(
-                    f"Expected {self.nargs}!={len(value)} for parameter {self.name}"
-                )
-
-        elif self.nargs in (-1, 1) and not isinstance(value, collections.abc.Sequence):
-            # if nargs in (-1, 1) and value is a scalar, convert to a list
+        return self._parse(value)
+
+    def _parse_scalar(self, value):
+        """single value"""
+        return self._convert(value)
+
+    def _parse_fixed(self, value):
+        """fixed number of values"""
+        if not isinstance(value, collections.abc.Sequence):
+            raise ParameterError(
+                f"Expected {self.nargs} values for parameter {self.name}"
+            )
+        elif len(value) != self.nargs:
+            raise ParameterError(
+                f"Expected {self.nargs}!={len(value)} for parameter {self.name}"
+            )
+        return self._parse_sequence(value)
+
+    def _parse_variadic(self, value):
+        """any number of values"""
+        if not isinstance(value, collections.abc.Sequence):
+            # if value is a scalar, convert to a list
             value = [value]
+        return self._parse_sequence(value)
 
-        # else: multiple values
+    def _parse_sequence(self, value):
+        """multiple values"""
+        convert = self._convert
         seqtype = type(value)
-        return seqtype(self.type(item) for item in value)
+        if seqtype is list:
+            return [convert(item) for item in value]
+        elif seqtype is tuple:
+            return tuple([convert(item) for item in value])
+        return seqtype(convert(item) for item in value)
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        elif not isinstance(other, Parameter):
+            return NotImplemented
         attrs = (self.type, self.nargs, self.default, self.none)
         return attrs == (other.type, other.nargs, other.default, other.none)
 
+    def __hash__(self):
+        return hash((id(self.type), self.nargs, self.none))
+
     def __str__(self):
-        if not self.nargs:
-            return f"{self.type}"
+        if self._str is not None:
+            return self._str
+        elif not self.nargs:
+            self._str = f"{self.type}"
         elif self.nargs > 0:
-            return ",".join([str(self.type)] * self.nargs)
+            self._str = ",".join([str(self.type)] * self.nargs)
         else:
-            return f"{self.type}*"
+            self._str = f"{self.type}*"
+        return self._str
 
     def __repr__(self):
-        return f"Parameter({self.type}, name={self.name}, default={self.default}, nargs={self.nargs})"
+        if self._repr is None:
+            self._repr = f"Parameter({self.type}, name={self.name}, default={self.default}, nargs={self.nargs})"
+        return self._repr
 
     @property
     def info(self):
         """return a dict representation"""
-        info = {
-            "type": self.type,
-            "name": self.name,
-            "default": self.default,
-            "nargs": self.nargs,
-            "none": self.none,
-            "required": self.required,
-            "flags": self.flags,
-            "help": self.help,
-        }
-        return info
+        if self._info is None:
+            # parameters are not modified after init
+            self._info = {
+                "type": self.type,
+                "name": self.name,
+                "default": self.default,
+                "nargs": self.nargs,
+                "none": self.none,
+                "required": self.required,
+                "flags": self.flags,
+                "help": self.help,
+            }
+        return self._info
 
 
 # parameter types
 
 
+def convert_str(value):
+    return value if value.__class__ is str else str(value)
+
+
+def convert_int(value):
+    return value if value.__class__ is int else int(value)
+
+
+def convert_float(value):
+    return value if value.__class__ is float else float(value)
+
+
+# converters of base types, skipping conversion if value is already of the right type
+CONVERTERS = {str: convert_str, int: convert_int, float: convert_float}
+
+
 class BaseType(ParameterType):
+    __slots__ = ("types", "name", "_converters")
+
     def __init__(self, type, *types, name=None):
         self.types = (type,) + tuple(types)
         if name is None:
@@ -248,11 +360,12 @@ class BaseType(ParameterType):
                 self.name = "/".join(map(str, self.types))
         else:
             self.name = name
+        self._converters = tuple(CONVERTERS.get(type, type) for type in self.types)
 
     def convert(self, value):
-        for type in self.types:
+        for converter in self._converters:
             try:
-                return type(value)
+                return converter(value)
             except ValueError as exc:
                 pass
         raise ParameterError(f"Invalid value type: {value}")
@@ -280,6 +393,7 @@ BASE_TYPES = {
     bool: BOOL,
     "BOOL": BOOL,
 }
+BASE_LOOKUP = {None: STRING, **BASE_TYPES}
 
 # choice
 
@@ -287,7 +401,10 @@ BASE_TYPES = {
 class Choice(ParameterType):
     """A multiple choice parameter"""
 
+    __slots__ = ("values", "flags", "_value_set")
+
     def __init__(self, values):
+        self.flags = None
         if len(values) < 1:
             raise ValueError("A Choice must have at least two values")
         if isinstance(values, dict):
@@ -298,9 +415,19 @@ class Choice(ParameterType):
         else:
             raise ValueError("A Choice must be a sequence/dict of items")
         self.values = values
+        try:
+            self._value_set = frozenset(values)
+        except TypeError:
+            # unhashable values
+            self._value_set = values
 
     def convert(self, value):
-        if not value in self.values:
+        try:
+            valid = value in self._value_set
+        except TypeError:
+            # unhashable value
+            valid = value in self.values
+        if not valid:
             raise ParameterError(f"Value {value} is not among {self.values}")
         return value
 
@@ -309,9 +436,14 @@ class Choice(ParameterType):
 
 
 # flags and switches
+FLAG_VALUES = {"true": True, "1": True, "false": False, "0": False}
+
+
 class Flag(ParameterType):
     """boolean flag"""
 
+    __slots__ = ("enable", "disable", "flags")
+
     def __init__(self, enable=None, disable=None):
         self.enable = enable
         self.disable = disable
@@ -322,11 +454,11 @@ class Flag(ParameterType):
             self.flags[disable] = False
 
     def convert(self, value):
-        if isinstance(value, str):
+        if value.__class__ is bool:
+            return value
+        elif isinstance(value, str):
             try:
-                return {"true": True, "1": True, "false": False, "0": False}[
-                    value.lower()
-                ]
+                return FLAG_VALUES[value.lower()]
             except KeyError:
                 raise ParameterError(f"Invalid flag value: {value}")
         return bool(value)
@@ -341,6 +473,8 @@ class Flag(ParameterType):
 class Switch(ParameterType):
     """multi-value switch"""
 
+    __slots__ = ("values", "flags")
+
     def __init__(self, dct=None, **values):
         if dct:
             values = {**dct, **values}
@@ -364,36 +498,85 @@ class Switch(ParameterType):
 class Path(ParameterType):
     """A Path type"""
 
+    __slots__ = ("exists",)
+
     def __init__(self, exists=False):
         self.exists = exists
 
     def convert(self, value):
-        value = str(value).replace("\\", os.path.sep).replace("/", os.path.sep)
-        path = pathlib.Path(value)
-        if self.exists and not path.exists():
+        path = normalize_path(str(value))
+        if self.exists and not os.path.exists(path):
             raise ParameterError(f"Path: {path} does not exists")
-        return str(path)
+        return path
 
     def __repr__(self):
         return "Path"
 
 
+@functools.lru_cache(maxsize=1024)
+def normalize_path(value):
+    """normalize path separators (cached)"""
+    value = value.replace("\\", os.path.sep).replace("/", os.path.sep)
+    return str(pathlib.Path(value))
+
+
 # config
+class ConfigDict(dict):
+    """dict with a `filename` attribute"""
+
+    filename = None
+
+
+class ConfigList(list):
+    """list with a `filename` attribute"""
+
+    filename = None
+
+
+class ConfigTuple(tuple):
+    """tuple with a `filename` attribute"""
+
+    filename = None
+
+
+CONFIG_FILE_CLASSES = {dict: ConfigDict, list: ConfigList, tuple: ConfigTuple}
+CONFIG_FILE_TYPES = tuple(CONFIG_FILE_CLASSES.values())
+
+
 class Config(ParameterType):
     """A configuration/dictionary parameter"""
 
+    __slots__ = ("exts", "_presets_source", "_presets")
+
     @staticmethod
     def config_file(container, filename=None):
-        if not isinstance(container, (list, tuple, dict)):
-            raise ParameterError(f'Expecting list or dict, got: {container}')
-        cls = type('Config', (type(container),), {})
+        if isinstance(container, CONFIG_FILE_TYPES) and filename is None:
+            # already a config file
+            return container
+        elif not isinstance(container, (list, tuple, dict)):
+            raise ParameterError(f"Expecting list or dict, got: {container}")
+        cls = CONFIG_FILE_CLASSES.get(type(container))
+        if cls is None:
+            cls = type("Config", (type(container),), {})
         obj = cls(container)
         obj.filename = filename
         return obj
-    
+
     def __init__(self, presets=None, exts=[".yml", ".txt", ".json"]):
         self.exts = exts
-        self.presets = self.load_presets(presets)
+        if presets and not isinstance(presets, dict):
+            if not pathlib.Path(presets).is_dir():
+                raise ValueError(f"Invalid `presets`: {presets}")
+        # presets directory is scanned on first use
+        self._presets_source = presets
+        self._presets = None
+
+    @property
+    def presets(self):
+        """dict of presets (name: config or filename)"""
+        if self._presets is None:
+            self._presets = self.load_presets(self._presets_source)
+        return self._presets
 
     def load_presets(self, presets):
         """load presets as dictionary"""
@@ -402,11 +585,19 @@ class Config(ParameterType):
         elif isinstance(presets, dict):
             return presets
         elif pathlib.Path(presets).is_dir():
-            # load presets
+            # load presets (single directory scan)
+            exts = tuple(self.exts)
+            with os.scandir(presets) as entries:
+                files = [
+                    pathlib.Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(exts)
+                ]
             _presets = {}
-            for ext in self.exts:
-                for file in pathlib.Path(presets).glob(f"*{ext}"):
-                    _presets[file.stem] = file
+            for ext in exts:
+                for file in files:
+                    if file.name.endswith(ext):
+                        _presets[file.stem] = file
             return _presets
         else:
             raise ValueError(f"Invalid `presets`: {presets}")
@@ -415,17 +606,19 @@ class Config(ParameterType):
         """load config file from file"""
         with open(file, "r") as fp:
             return fp.read()
-    
-    def parse(self, string):
-        try:  # YAML
-            return yaml.safe_load(string)
-        except Exception as exc:
-            pass
-        try:  # JSON
-            return json.loads(string)
-        except json.decoder.JSONDecodeError as exc:
-            pass
-        raise OSError(f"Invalid YAML/Json format: {string}")
+
+    def parse(self, string, ext=None):
+        """parse YAML/Json string (Json first if `ext` is ".json")"""
+        # copy: cached containers must not be modified
+        return copy.deepcopy(parse_config_cached(string, ext))
+
+    def parse_file(self, file):
+        """load and parse config file"""
+        string = self.load(file)
+        if type(self).parse is not Config.parse:
+            # custom parse method (without `ext` argument)
+            return self.parse(string)
+        return self.parse(string, ext=pathlib.Path(file).suffix.lower())
 
     def convert(self, value):
         presets = self.presets
@@ -435,8 +628,7 @@ class Config(ParameterType):
         if isinstance(value, dict):
             config = value
         elif pathlib.Path(value).is_file():
-            # breakpoint()
-            config = self.parse(self.load(value))
+            config = self.parse_file(value)
             filename = value
         elif isinstance(value, str):
             config = self.parse(value)
@@ -449,24 +641,64 @@ class Config(ParameterType):
         return f"Config(presets={presets})"
 
 
+def parse_config(string, ext=None):
+    """parse YAML/Json string (try Json first if `ext` is ".json")"""
+    import yaml  # lazy imports: only needed for Config parameters
+    import json
+
+    if ext == ".json":
+        try:  # JSON
+            return json.loads(string)
+        except json.decoder.JSONDecodeError as exc:
+            pass
+    try:  # YAML
+        return yaml.safe_load(string)
+    except Exception as exc:
+        pass
+    try:  # JSON
+        return json.loads(string)
+    except json.decoder.JSONDecodeError as exc:
+        pass
+    raise OSError(f"Invalid YAML/Json format: {string}")
+
+
+@functools.lru_cache(maxsize=256)
+def parse_config_cached(string, ext=None):
+    """parse YAML/Json string (cached on string and extension)"""
+    return parse_config(string, ext=ext)
+
+
 # Variable input/output
 class VariableIO(ParameterType):
     """Parameter Type to setup a variable TargetType (Input/Output)"""
 
+    __slots__ = ("default_type", "default_handler", "_io_cache")
+
+    max_cache_size = 1024
+
     def __init__(self, *, type=None, handler=None):
         self.default_type = type
         self.default_handler = handler
+        self._io_cache = {}
 
     def convert(self, value):
         """return TargetType"""
         if isinstance(value, TargetType):
             return value
+        target_type = self._io_cache.get(value)
+        if target_type is not None:
+            return target_type
+
         _, target_type = parse_string_io(value)
         if target_type.type is None:
             if self.default_type:
                 target_type.type = self.default_type
             elif target_type.handler is None:
                 target_type.handler = self.default_handler
+
+        if len(self._io_cache) >= self.max_cache_size:
+            self._io_cache.clear()
+        self._io_cache[value] = target_type
         return target_type
 
     def __repr__(self):
@@ -476,8 +708,11 @@ class VariableIO(ParameterType):
 class VariableSelector(VariableIO):
     """Setup fixed choice of variable TargetType"""
 
+    __slots__ = ("choice", "flags")
+
     def __init__(self, obj, *, type=None, handler=None):
         choice, flags = {}, {}
+        self.flags = None
 
         if isinstance(obj, (list, tuple)):
             for dest in obj:
@@ -502,9 +737,10 @@ class VariableSelector(VariableIO):
         self.choice = choice
 
     def convert(self, value):
-        if not value in self.choice:
+        target_type = self.choice.get(value, MISSING)
+        if target_type is MISSING:
             raise ParameterError(f"Invalid option value: {value}")
-        return self.choice[value]
+        return target_type
 
     def __repr__(self):
         return f"Variable I/O (choices: {list(self.choice)})"
@@ -513,6 +749,8 @@ class VariableSelector(VariableIO):
 class Freeze(ParameterType):
     """Freeze parameter value"""
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -118,9 +118,22 @@ import pathlib
 import yaml
 import re
 import itertools
+import functools
 from .target import Target, Identifier, Index, Branch
 from .utils import id_from_string, id_to_string, target_repr, identifier_repr
 
+try:
+    # use libyaml-based loader if available
+    from yaml import CSafeLoader as BatchLoader
+except ImportError:
+    from yaml import SafeLoader as BatchLoader
+
+try:
+    # optional: linear-time regex engine for wildcard searches
+    import re2 as wildcard_engine
+except ImportError:
+    wildcard_engine = re
+
 
 class IndexParserError(ValueError):
     """Exception class for parsing errors"""
@@ -132,6 +145,10 @@ class BatchFileError(Exception):
     """Exception for handling batch files parsing errors"""
 
 
+# group expression: [a|b]
+RE_GROUP = re.compile(r"(\[[^\]]+\])")
+
+
 class IndexParser:
     """Parse identifiers and targets
 
@@ -170,21 +187,38 @@ class IndexParser:
 
         self.strids = {}
         self.strtargets = {}
+        # stored instance of each identifier
+        self._id_pool = {}
+        self._escape_cache = {}
+        # prefix index of strids/strtargets
+        self._id_prefix_index = {}
+        self._target_prefix_index = {}
+        # cache of parsed expressions
+        self._parse_cache = {}
         self.update_identifiers(identifiers)
         self.update_targets(targets)
 
     def update_identifiers(self, identifiers):
-        strids = {
-            Identifier(index, branch): identifier_repr(
-                index, branch, sep2=self.secondary
-            )
-            for index, branch in identifiers
-        }
-        self.strids = {**strids, **self.strids}
+        existing = self.strids
+        new = {}
+        for index, branch in identifiers:
+            id = Identifier(index, branch)
+            if id in existing or id in new:
+                continue
+            new[id] = identifier_repr(index, branch, sep2=self.secondary)
+        if new:
+            update_prefix_index(self._id_prefix_index, new)
+            self._parse_cache.clear()
+            self._id_pool.update(zip(new, new))
+            existing.update(new)
 
     def update_targets(self, targets):
-        strtargets = {
-            target: target_repr(
+        existing = self.strtargets
+        new = {}
+        for target in targets:
+            if target in existing or target in new:
+                continue
+            new[target] = target_repr(
                 target.name,
                 target.index,
                 target.branch,
@@ -192,9 +226,10 @@ class IndexParser:
                 sep2=self.secondary,
                 nobranch=self.secondary,
             )
-            for target in targets
-        }
-        self.strtargets = {**strtargets, **self.strtargets}
+        if new:
+            update_prefix_index(self._target_prefix_index, new)
+            self._parse_cache.clear()
+            existing.update(new)
 
     def identifiers(self, strids, callback, search=True, exit=True):
         """parse and return list of identifiers with callback on error and optional exit"""
@@ -216,6 +251,39 @@ class IndexParser:
 
     def parse_identifiers(self, strids, search=True):
         """parse identifier expression and return list of identifiers"""
+        if isinstance(strids, str) and self._is_literal(strids):
+            # fast path: single identifier
+            try:
+                return self._parse_identifier_expr(strids, search)
+            except ValueError as exc:
+                raise IndexParserError(exc)
+        key = ("identifiers", strids, search)
+        return self._cached(key, self._parse_identifiers, strids, search)
+
+    def parse_targets(self, strids, search=True, exists=True):
+        """parse target expression and return list of targets"""
+        if isinstance(strids, str) and self._is_literal(strids):
+            # fast path: single target
+            try:
+                return self._parse_target_expr(strids, search, exists)
+            except ValueError as exc:
+                raise IndexParserError(exc)
+        key = ("targets", strids, search, exists)
+        return self._cached(key, self._parse_targets, strids, search, exists)
+
+    def _cached(self, key, func, *args):
+        """return cached result of func(*args) (cache is reset on updates)"""
+        try:
+            key = tuple(tuple(v) if isinstance(v, list) else v for v in key)
+            result = self._parse_cache.get(key)
+        except TypeError:
+            # unhashable expression
+            return func(*args)
+        if result is None:
+            result = self._parse_cache[key] = func(*args)
+        return list(result)
+
+    def _parse_identifiers(self, strids, search):
         grouped = self._parse_groups(strids)
         try:
             return [
@@ -226,8 +294,7 @@ class IndexParser:
         except ValueError as exc:
             raise IndexParserError(exc)
 
-    def parse_targets(self, strids, search=True, exists=True):
-        """parse target expression and return list of targets"""
+    def _parse_targets(self, strids, search, exists):
         grouped = self._parse_groups(strids)
         try:
             return [
@@ -250,30 +317,24 @@ class IndexParser:
         """parse string ids for groups"""
         if isinstance(strids, (list, tuple)):
             return [group for item in strids for group in self._parse_groups(item)]
-        elif not set(self.groupdel) & set(strids):
+        elif self.groupdel[0] not in strids and self.groupdel[1] not in strids:
             return [strids]
 
-        groups = {}
-
-        def _replace(match):
-            matchstr = match.group(1)
-            group = f"__group_{len(groups)}"
+        # split literal parts and groups
+        parts = RE_GROUP.split(strids)
+        literals = parts[0::2]
+        groups = []
+        for matchstr in parts[1::2]:
             values = matchstr[1:-1].split(self.groupsep)
             if len(values) <= 1:
                 raise ValueError(f"Invalid group syntax: {matchstr}")
-            groups[group] = values
-            return f"{{{group}}}"
-
-        # replace groups
-        replaced = re.sub(r"(\[[^\]]+\])", _replace, strids)
+            groups.append(values)
 
         # return all combinations
-        versions = []
-        for comb in itertools.product(*list(groups.values())):
-            format = {group: value for group, value in zip(groups, comb)}
-            versions.append(replaced.format(**format))
-
-        return versions
+        return [
+            "".join(itertools.chain.from_iterable(zip(literals, comb + ("",))))
+            for comb in itertools.product(*groups)
+        ]
 
     def _parse_target_expr(self, string, search, exists):
         """parse string target and return list of targets"""
@@ -282,7 +343,7 @@ class IndexParser:
             # return all targets
             return sorted(self.strtargets)
 
-        elif not {self.wc_any, self.wc_some} & set(string):
+        elif not self._is_search(string):
             # no searching
             if not self.primary in string:
                 # invalid id
@@ -316,14 +377,15 @@ class IndexParser:
         # end character
         endchar = "$" if self.secondary in string else ""
 
+        # candidate targets
+        candidates = self._search_candidates(
+            string, self.strtargets, self._target_prefix_index
+        )
+
         # regex
         string = self._escape_string(string)
-        regex = re.compile(startchar + string + endchar)
-        match = [
-            target
-            for target, strtarget in self.strtargets.items()
-            if regex.search(strtarget)
-        ]
+        regex = compile_regex(startchar + string + endchar)
+        match = [target for target, strtarget in candidates if regex.search(strtarget)]
 
         return match
 
@@ -338,7 +400,7 @@ class IndexParser:
             # invalid id
             raise IndexParserError(f"Cannot have '{self.primary}' in identifier string")
 
-        elif not {self.wc_any, self.wc_some} & set(string):
+        elif not self._is_search(string):
             split = string.split(self.secondary)
             if len(split) == 1:
                 head = split[0]
@@ -349,46 +411,111 @@ class IndexParser:
 
             index = id_from_string(head, self.sepindex, none="")
             branch = id_from_string(tail, self.sepbranch, none="")
-            return [Identifier(index, branch)]
+            id = Identifier(index, branch)
+            # share the stored instance
+            return [self._id_pool.get(id, id)]
         elif not search:
             raise IndexParserError("Wildcards are not accepted ")
 
         # else: search identifiers
 
         # is all indices ?
-        not_all_indices = string.split("~")[0] != "*"
+        not_all_indices = string.split(self.secondary)[0] != self.wc_any
 
-        # start char
-        startchar = "^"  # if string[0] != self.secondary else ""
-        # end character
-        endchar = "$" if self.secondary in string else ""
+        # candidate identifiers
+        candidates = self._search_candidates(string, self.strids, self._id_prefix_index)
 
         # regex
-        string = self._escape_string(string)
-        regex = re.compile(startchar + string + endchar)
+        regex = compile_regex(self._identifier_pattern(string))
         match = [
             id
-            for id, strid in self.strids.items()
+            for id, strid in candidates
             if (regex.search(strid) and (not_all_indices or id.index))
         ]
 
         return match
 
+    def _is_literal(self, string):
+        """whether string expression has no groups, wildcards or 'all' symbol"""
+        return not (
+            self.groupdel[0] in string
+            or self.groupdel[1] in string
+            or self._is_search(string)
+            or string.strip("' ") == self.wc_all
+        )
+
+    def _is_search(self, string):
+        """whether string expression contains wildcards"""
+        return self.wc_any in string or self.wc_some in string
+
+    def _identifier_pattern(self, string):
+        """regex pattern of wildcard identifier expression"""
+        # start char
+        startchar = "^"  # if string[0] != self.secondary else ""
+        # end character
+        endchar = "$" if self.secondary in string else ""
+        return startchar + self._escape_string(string) + endchar
+
+    def _search_candidates(self, string, strings, prefix_index):
+        """return (key, string) pairs whose string may match the expression"""
+        # literal prefix of the expression
+        prefix = string
+        for i, char in enumerate(string):
+            if char in (self.wc_any, self.wc_some, "^"):
+                prefix = string[:i]
+                break
+        if not prefix:
+            return strings.items()
+        keys = prefix_index.get(prefix[:PREFIX_LENGTH], [])
+        return [(key, strings[key]) for key in keys]
+
     def _escape_string(self, string, chars="."):
+        key = (string, chars)
+        escaped = self._escape_cache.get(key)
+        if escaped is None:
+            escaped = self._escape_cache[key] = self._escape(string, chars)
+        return escaped
+
+    def _escape(self, string, chars):
         # remove excape chars
         string = string.replace("^*", "*")
-        # has wildcard
-        if self.wc_any in string:
-            string = string.replace(self.wc_any, "__WILDCARD_0__")
-        if self.wc_some in string:
-            string = string.replace(self.wc_some, "__WILDCARD_1__")
-        # escape
-        string = (
-            re.escape(string)
-            .replace("__WILDCARD_0__", f"{chars}*")
-            .replace("__WILDCARD_1__", f"{chars}+")
-        )
-        return string
+        # escape and replace wildcards in a single pass
+        return string.translate(escape_table(self.wc_any, self.wc_some, chars))
+
+
+# characters escaped by re.escape
+REGEX_SPECIAL_CHARS = {c: "\\" + chr(c) for c in b"()[]{}?*+-|^$\\.&~# \t\n\r\v\f"}
+
+
+@functools.lru_cache(maxsize=None)
+def escape_table(wc_any, wc_some, chars):
+    """translation table escaping regex characters and replacing wildcards"""
+    return {
+        **REGEX_SPECIAL_CHARS,
+        ord(wc_any): f"{chars}*",
+        ord(wc_some): f"{chars}+",
+    }
+
+
+# length of indexed prefixes
+PREFIX_LENGTH = 3
+
+
+def update_prefix_index(index, strings):
+    """index keys of `strings` by the first characters of their string value"""
+    for key, string in strings.items():
+        for i in range(1, min(len(string), PREFIX_LENGTH) + 1):
+            index.setdefault(string[:i], []).append(key)
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_regex(pattern):
+    """compile wildcard search regular expression (cached)"""
+    return wildcard_engine.compile(pattern)
+
+
+# normalize path separators
+PATH_SEPARATORS = str.maketrans({"\\": os.path.sep, "/": os.path.sep})
 
 
 def parse_batch(file, indexparser, programs=[], new_branches=None, check_path=True):
@@ -408,7 +535,7 @@ def parse_batch(file, indexparser, programs=[], new_branches=None, check_path=Tr
             raise BatchFileError(f"Could not find batch file: {filename}")
         with open(filename) as fp:
             try:
-                batch = yaml.safe_load(fp)
+                batch = yaml.load(fp, Loader=BatchLoader)
             except Exception as exc:
                 raise BatchFileError(f"Invalid batch file ({filename}): {exc}")
             if not batch:
@@ -477,22 +604,24 @@ def parse_batch(file, indexparser, programs=[], new_branches=None, check_path=Tr
     # path options
     try:
         path_prefix = config.get("PATH", config.get("PREFIX", "."))
-        path_prefix = pathlib.Path(path_prefix.replace("\\", os.path.sep).replace("/", os.path.sep))
+        path_prefix = pathlib.Path(path_prefix.translate(PATH_SEPARATORS))
         if path_prefix.is_absolute():
             path_prefix = path_prefix.resolve()
         else:
             path_prefix = (pathlib.Path(filename.parent) / path_prefix).resolve()
     except:
         raise BatchFileError(f"Invalid path prefix: {config.get('PATH')}")
-    
+
     # parse batch
     tasks = []
     attachments = {}
+    resolved_paths = {}  # task paths are often shared: resolve them once
+    existing_paths = set()
     for taskname, task in batch.items():
         # parse i/o ids
         if not task:
             task = {}
-        if {"inputs", "outputs"} <= set(task):
+        if "inputs" in task and "outputs" in task:
             # both inputs and outputs
             input_ids = indexparser.parse_identifiers(task.pop("inputs"))
             output_ids = indexparser.parse_identifiers(task.pop("outputs"))
@@ -531,16 +660,16 @@ def parse_batch(file, indexparser, programs=[], new_branches=None, check_path=Tr
             else [Branch(id.branch) + newbranch for id in output_ids]
         )
 
-        # task's programs
-        programs = {
-            p.name: task.pop(p) for p in list(task) if isinstance(p, YAMLProgram)
-        }
-
-        # output target's attachement
-        targets = {p.name: task.pop(p) for p in list(task) if isinstance(p, YAMLTarget)}
-
-        # task's metadata
-        metadata = {p.name: task.pop(p) for p in list(task) if isinstance(p, YAMLMeta)}
+        # task's programs, output target's attachement and task's metadata
+        programs, targets, metadata = {}, {}, {}
+        tagged = {YAMLProgram: programs, YAMLTarget: targets, YAMLMeta: metadata}
+        for key in list(task):
+            # walk the mro so that subclasses of the yaml tags are dispatched too
+            for cls in type(key).__mro__:
+                items = tagged.get(cls)
+                if items is not None:
+                    items[key.name] = task.pop(key)
+                    break
 
         # add tagless programs
         tagless = [item for item in task if isinstance(item, str)]
@@ -600,7 +729,7 @@ def parse_batch(file, indexparser, programs=[], new_branches=None, check_path=Tr
             if YAMLMacro("CONDITION") in parameters:
                 # eval expression
                 expr = parameters.pop(YAMLMacro("CONDITION"))
-                ans = eval(expr, None, parameters)
+                ans = eval(compile_condition(expr), CONDITION_GLOBALS, parameters)
                 if not ans:
                     # skip
                     continue
@@ -617,23 +746,26 @@ def parse_batch(file, indexparser, programs=[], new_branches=None, check_path=Tr
 
             # special case: path
             if "path" in parameters:
-                try:
-                    path = pathlib.Path(
-                        parameters["path"]
-                        .replace("\\", os.path.sep)
-                        .replace("/", os.path.sep)
-                    )
-                    if not path.is_absolute():
-                        path = (path_prefix / path).resolve()
-                except:
-                    raise BatchFileError(
-                        f"In task '{taskname}', invalid path: '{parameters['path']}'"
-                    )
-
-                if check_path and not path.exists():
-                    raise BatchFileError(
-                        f"In task '{taskname}', path does not exist: {path}"
-                    )
+                path = parameters["path"]
+                if isinstance(path, str) and path in resolved_paths:
+                    path = resolved_paths[path]
+                else:
+                    try:
+                        path = pathlib.Path(path.translate(PATH_SEPARATORS))
+                        if not path.is_absolute():
+                            path = (path_prefix / path).resolve()
+                    except:
+                        raise BatchFileError(
+                            f"In task '{taskname}', invalid path: '{parameters['path']}'"
+                        )
+                    resolved_paths[parameters["path"]] = path
+
+                if check_path and path not in existing_paths:
+                    if not path.exists():
+                        raise BatchFileError(
+                            f"In task '{taskname}', path does not exist: {path}"
+                        )
+                    existing_paths.add(path)
                 parameters["path"] = str(path)
 
             # make task
@@ -655,8 +787,24 @@ def parse_batch(file, indexparser, programs=[], new_branches=None, check_path=Tr
     return tasks, attachments
 
 
+# namespace of CONDITION expressions
+CONDITION_GLOBALS = {
+    "__builtins__": {
+        func.__name__: func
+        for func in [abs, all, any, bool, float, int, len, max, min, round, str]
+    }
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_condition(expr):
+    """compile CONDITION expression (cached)"""
+    return compile(str(expr), "<condition>", "eval")
+
+
 class YAMLKey(yaml.YAMLObject):
-    yaml_loader = yaml.SafeLoader
+    # register tags to both safe loaders (yaml.safe_load and batch files)
+    yaml_loader = [yaml.SafeLoader, BatchLoader]
 
     def __init__(self, name):
         self.name = name
@@ -751,12 +899,15 @@ def generate_template(template, cases):
 
 def is_template(template):
     """check if object is template"""
-    if isinstance(template, str) and RE_TEMPLATE.search(template):
+    if isinstance(template, (dict, list)) and not "<" in str(template):
+        # no template variable anywhere in the container
+        return False
+    elif isinstance(template, str) and RE_TEMPLATE.search(template):
         return True
     elif isinstance(template, YAMLKey) and RE_TEMPLATE.search(template.name):
         return True
     elif isinstance(template, list):
-        if any(is_template(item) for item in value):
+        if any(is_template(item) for item in template):
             return True
     elif isinstance(template, dict):
         if any(is_template(key) for key in template):
@@ -819,13 +970,27 @@ def combine_variables(*dicts):
         else:
             combs1 = [{**d2, **d1} for d1, d2 in itertools.product(combinations, combs)]
             combs2 = [{**d1, **d2} for d1, d2 in itertools.product(combinations, combs)]
-            combinations = []
-            for dct in combs1 + combs2:
-                if not dct in combinations:
-                    combinations.append(dct)
+            combinations = unique_dicts(combs1 + combs2)
     return combinations
 
 
+def unique_dicts(dicts):
+    """remove duplicated dicts (keep order)"""
+    unique, seen = [], set()
+    for dct in dicts:
+        try:
+            key = tuple(sorted(dct.items()))
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError:
+            # unhashable values
+            if dct in unique:
+                continue
+        unique.append(dct)
+    return unique
+
+
 #
 # post process parameters
 
@@ -862,22 +1027,26 @@ def process_parameter_value(value):
     return auto_complete(value)
 
 
+# numbered value: prefix + number
+RE_AUTO_NUM = re.compile(r"^(.*?)(\d+)$")
+
+
 def auto_complete(lst, placeholder="..."):
     """auto complete list of string, using a place holder"""
-    while True:
-        try:
-            index = lst.index(placeholder)
-        except ValueError:
-            return lst
+    completed = []
+    for index, item in enumerate(lst):
+        if item != placeholder:
+            completed.append(item)
+            continue
 
         if index in (0, len(lst) - 1):
             raise ValueError(
                 f"Missing lower or upper value for auto-complete in: {lst}"
             )
-        prev = lst[index - 1]
+        prev = completed[-1]
         next = lst[index + 1]
-        match1 = re.match(r"^(.*?)(\d+)$", str(prev))
-        match2 = re.match(r"^(.*?)(\d+)$", str(next))
+        match1 = RE_AUTO_NUM.match(str(prev))
+        match2 = RE_AUTO_NUM.match(str(next))
         if match1 is None or match2 is None:
             raise ValueError(
                 f"Cannot auto complete values with no number: {prev}, {next}"
@@ -891,7 +1060,8 @@ def auto_complete(lst, placeholder="..."):
         first = int(match1.group(2))
         last = int(match2.group(2))
         values = range(first + 1, last) if last >= first else range(first - 1, last, -1)
-        lst = lst[:index] + [f"{prefix1}{num}" for num in values] + lst[index + 1 :]
+        completed.extend(f"{prefix1}{num}" for num in values)
+    return completed
 
 
 #
@@ -901,8 +1071,13 @@ def auto_complete(lst, placeholder="..."):
 def apply_modifiers(tasks, modifiers):
     """update task list from modifiers"""
     new = []
+    modifiers = list(modifiers.values())
     for task in tasks:
-        for modifier in modifiers.values():
+        name = task["program"]
+        for modifier in modifiers:
+            if not name in modifier:
+                # modifier does not apply
+                continue
             _task = task.copy()
             branch = modifier.get("branch", None)
             if branch:
@@ -910,10 +1085,10 @@ def apply_modifiers(tasks, modifiers):
                     _task["output_branches"] = branch
                 else:
                     _task["output_branches"] = task["output_branches"] + branch
-            if (name := task["program"]) in modifier:
-                params = modifier[name].copy()
-                if "program" in params:
-                    _task["program"] = params.pop("program")
-                _task["parameters"] = {**task["parameters"], **params}
-                new.append(_task)
+            params = modifier[name]
+            if "program" in params:
+                _task["program"] = params["program"]
+                params = {key: params[key] for key in params if key != "program"}
+            _task["parameters"] = {**task["parameters"], **params}
+            new.append(_task)
     return new
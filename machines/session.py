@@ -2,6 +2,7 @@
 """ Session class """
 
 import os
+import itertools
 import logging
 import uuid
 
@@ -14,6 +15,13 @@ from .graph import DependencyGraph
 from .machine import MetaMachine, Machine, replay
 
 
+# task status names
+STATUS_NAMES = frozenset(status.name for status in Status)
+
+# status of tasks always shown by Session.monitor
+ISSUES = frozenset(["ERROR", "REJECTED", "RUNNING"])
+
+
 def basic_session(toolbox, main, temp=None, dedicated=None, **kwargs):
     """init a session with main, temp and dedicated storages"""
     storages = {}
@@ -39,7 +47,7 @@ class Session:
 
         # update storage with toolbox's outputs
         for program in toolbox.machines:
-            for io in program.flat_inputs + program.flat_outputs:
+            for io in itertools.chain(program.flat_inputs, program.flat_outputs):
                 if not io.dest in storages:
                     storages[io.dest] = storages[MAIN_STORAGE]
 
@@ -47,17 +55,33 @@ class Session:
         self.factory = factory(
             name=factory_name, storages=storages, auto_cleanup=auto_cleanup
         )
-        # unique storages
-        self.storages = set(storages.values())
+        # unique storages (in order)
+        self.storages = list({id(val): val for val in storages.values()}.values())
+        self._temp_storages = [val for val in self.storages if val.temporary]
+        self._storages_by_name = {}
+        for storage in self.storages:
+            self._storages_by_name.setdefault(storage.name, []).append(storage)
+
+        # cached info dictionary
+        self._info = None
+
+        # cache of program's parent machines (cf. autorun)
+        self._parents = {}
+        self._parents_version = None
 
     @property
     def info(self):
         """return info dictionary"""
-        return {
-            "toolbox": self.toolbox.name,
-            "factory": str(self.factory.name),
-            "storages": {key: str(val) for key, val in self.factory.storages.items()},
-        }
+        if self._info is None:
+            # the factory's storages are set at init
+            self._info = {
+                "toolbox": self.toolbox.name,
+                "factory": str(self.factory.name),
+                "storages": {
+                    key: str(val) for key, val in self.factory.storages.items()
+                },
+            }
+        return {**self._info, "storages": dict(self._info["storages"])}
 
     def stop(self, hold=False):
         """stop factory"""
@@ -66,13 +90,15 @@ class Session:
         if hold:
             self.factory.hold()
         # retrieve runnning tasks
-        tasks = [task for task in self.factory.tasks if task.status.name == "RUNNING"]
+        tasks = self.factory.snapshot_tasks()
+        tasks = [task for task in tasks if task.status.name == "RUNNING"]
         return tasks
 
     def clear(self):
         """clear new and pending tasks"""
         # retrieve runnning tasks
-        tasks = [task for task in self.factory.tasks if task.status.name == "RUNNING"]
+        tasks = self.factory.snapshot_tasks()
+        tasks = [task for task in tasks if task.status.name == "RUNNING"]
         self.factory.reset_queue()
         return tasks
 
@@ -131,21 +157,21 @@ class Session:
 
     def autorun(self, program, *args, **kwargs):
         """autorun"""
-        # get program relationships
-        relationships = self.toolbox.relationships
-
-        # get relevent machines
-        def get_parents(item):
-            machines = relationships.get(item, [])
-            for machine in list(machines):
-                for input in machine.input_names:
-                    machines.extend(get_parents(input))
-            return machines
-
         # run all programs
-        autorun = MetaMachine.from_list(get_parents(program))
+        autorun = MetaMachine.from_list(self.get_parents(program))
         return self.run(program, *args, machine=autorun, **kwargs)
 
+    def get_parents(self, program):
+        """return machines required to run program (including itself)"""
+        if self._parents_version != self.toolbox.version:
+            # toolbox changed
+            self._parents = {}
+            self._parents_version = self.toolbox.version
+        if not program in self._parents:
+            relationships = self.toolbox.relationships
+            self._parents[program] = get_parents(relationships, program)
+        return list(self._parents[program])
+
     def replay(self, history, dry=False, mode=None, hold=False, **kwargs):
         """replay task"""
 
@@ -175,47 +201,52 @@ class Session:
     def cleanup(self):
         """remove temporary targets"""
         targets = []
-        for storage in self.storages:
-            if storage.temporary:
-                targets.extend(storage.clear())
+        for storage in self._temp_storages:
+            targets.extend(storage.clear())
         return targets
 
     def list(self):
         """list targets"""
-        targets = set()
-        for storage in self.storages:
-            targets |= set(storage.list())
-        return list(targets)
+        iterators = [storage.iter_targets() for storage in self.storages]
+        return list(set(itertools.chain.from_iterable(iterators)))
 
     # def list_storages(self, targets=None, storages=None):
     def summary(self, targets=None, storages=None):
         """list targets by storage"""
         summary = {}
-        for storage in self.storages:
-            if storages and not storage.name in storages:
-                continue
-            elif targets is None:
+        for storage in self._select_storages(storages):
+            if targets is None:
                 _targets = storage.list()
             else:
-                _targets = [target for target in targets if storage.exists(target)]
+                _targets = storage.contains_many(targets)
             summary[storage] = sorted(_targets)
         return summary
 
     def location(self, targets=None, storages=None):
         """get path of targets"""
         locations = {}
-        for storage in self.storages:
-            if storages and not storage.name in storages:
-                continue
-            elif targets is None:
+        for storage in self._select_storages(storages):
+            if targets is None:
                 _targets = storage.list()
             else:
-                _targets = [target for target in targets if storage.exists(target)]
+                _targets = storage.contains_many(targets)
             locations[storage] = [
                 storage.location(target) for target in sorted(_targets)
             ]
         return locations
 
+    def _select_storages(self, names=None):
+        """return storages with given names (default: all storages)"""
+        if not names:
+            return self.storages
+        selected = {
+            storage
+            for name in set(names)
+            for storage in self._storages_by_name.get(name, [])
+        }
+        # keep the session's storage order
+        return [storage for storage in self.storages if storage in selected]
+
     def monitor(self, n=None, status=None, show_all=False):
         """return list of running or completed tasks
 
@@ -232,21 +263,23 @@ class Session:
         if status:
             if isinstance(status, str):
                 status = [status]
-            if not set(status) <= {s.name for s in Status}:
+            status = frozenset(status)
+            if not status <= STATUS_NAMES:
                 raise ValueError("Invalid status: %s" % status)
 
+        alltasks = self.factory.snapshot_tasks()
         if not n:
-            n = len(self.factory.tasks)
+            n = len(alltasks)
 
         tasks = []
-        issues = ["ERROR", "REJECTED", "RUNNING"]
-        for task in self.factory.tasks[::-1]:
+        for task in reversed(alltasks):
             if n <= 0:
                 break
-            if status and not task.status.name in status:
+            name = task.status.name
+            if status and not name in status:
                 # filter out tasks based on status
                 continue
-            elif task.status.name not in issues and not show_all and task.temporary:
+            elif not show_all and name not in ISSUES and task.temporary:
                 # filter out temporary tasks
                 continue
             tasks.append(task)
@@ -279,6 +312,29 @@ class Session:
 # utils
 
 
+def get_parents(relationships, name):
+    """return machines producing `name` and, recursively, their inputs"""
+    machines = []
+    visited_names = set()
+    visited_machines = set()
+    worklist = [name]
+    while worklist:
+        name = worklist.pop()
+        if name in visited_names:
+            continue
+        visited_names.add(name)
+
+        parents = relationships.get(name, [])
+        for machine in parents:
+            if not id(machine) in visited_machines:
+                visited_machines.add(id(machine))
+                machines.append(machine)
+        # depth-first: push inputs in reverse order
+        inputs = [input for machine in parents for input in machine.input_names]
+        worklist.extend(reversed(inputs))
+    return machines
+
+
 def setup_storages(toolbox, workdir, tempdir=None, targetdirs=None, target_lock=None):
     """helper for creating dict of storages from toolbox
 
@@ -4,6 +4,8 @@
 import logging
 import uuid
 import threading
+import collections
+import operator
 from .common import Status, TargetIsLocked, TargetAlreadyExists, TargetDoesNotExist
 from .target import Target
 from .filedb import FileDB
@@ -21,6 +23,28 @@ def withlock(func):
     return wrapper
 
 
+def withreadlock(func):
+    """decorator for locking reads (skipped if memory supports concurrent reads)"""
+
+    def wrapper(self, *args, **kwargs):
+        if self.concurrent_read:
+            return func(self, *args, **kwargs)
+        with self.lock:
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _NullLock:
+    """no-op lock for storages used by a single thread"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
 # storages
 
 
@@ -35,6 +59,8 @@ class TargetStorage:
         comparators=None,
         name=None,
         target_lock=None,
+        max_entries=None,
+        thread_safe=True,
         **callbacks,
     ):
         """Init Storage
@@ -46,17 +72,31 @@ class TargetStorage:
                 * __getitem__
                 * __setitem__
                 default: dict()
+                reads are not locked if memory is a dict or
+                has a True `supports_concurrent_read` attribute
             temporary: flag used in factory for cleanup
+            max_entries: maximum number of targets in a temporary dict storage
+                (least recently used targets are removed first)
+            thread_safe: if False, do not lock the storage (single-threaded use only)
             callbacks: on_read, on_write, on_del, callback functions
                 with argument target (and second argument value for on_write)
         """
         if memory is None:
             memory = {}
+        if max_entries is not None:
+            if not temporary or not isinstance(memory, dict):
+                raise ValueError("max_entries requires a temporary dict memory")
+            memory = collections.OrderedDict(memory)
         self.memory = memory
+        self.max_entries = max_entries
         self.uuid = uuid.uuid4()
         self.name = str(name) if name is not None else str(self.uuid)
         self.temporary = temporary
-        self.lock = threading.RLock()
+        self.lock = threading.RLock() if thread_safe else _NullLock()
+        # dict lookups are atomic: only writes need locking
+        self.concurrent_read = type(memory) is dict or getattr(
+            memory, "supports_concurrent_read", False
+        )
 
         self.on_read = callbacks.get("on_read", None)
         self.on_write = callbacks.get("on_write", None)
@@ -73,7 +113,9 @@ class TargetStorage:
         self.comparators = comparators
 
         # readonly targets
-        self.target_lock = target_lock if target_lock else []
+        if isinstance(target_lock, str):
+            target_lock = [target_lock]
+        self.target_lock = frozenset(target_lock) if target_lock else frozenset()
 
     def __repr__(self):
         return f"Storage({self.memory})"
@@ -81,7 +123,7 @@ class TargetStorage:
     def __str__(self):
         return f"Storage({self.name})"
 
-    @withlock
+    @withreadlock
     def exists(self, target):
         """Check whether target data exists"""
         if not isinstance(target, Target):
@@ -89,7 +131,18 @@ class TargetStorage:
 
         return target in self.memory
 
-    @withlock
+    @withreadlock
+    def contains_many(self, targets):
+        """return the set of targets whose data exists"""
+        targets = list(targets)
+        for target in targets:
+            if not isinstance(target, Target):
+                raise TypeError("Invalid target object: %s" % target)
+        if isinstance(self.memory, dict):
+            return self.memory.keys() & set(targets)
+        return {target for target in targets if target in self.memory}
+
+    @withreadlock
     def locked(self, target):
         """return True if target exists and is locked"""
         if not self.exists(target):
@@ -103,14 +156,24 @@ class TargetStorage:
         except AttributeError:
             pass
 
-    @withlock
+    @withreadlock
     def list(self):
         """list targets in storage"""
         return list(self.memory)
 
+    def iter_targets(self):
+        """iterate targets in storage (storage is locked until exhaustion)"""
+        with self.lock:
+            yield from self.memory
+
     @withlock
     def failed(self):
         """return error list targets in storage"""
+        if isinstance(self.memory, dict):
+            return []
+        elif hasattr(self.memory, "failed"):
+            return self.memory.failed()
+        # else: retrieve value returned by the iterator
         try:
             iterator = iter(self.memory)
             while True:
@@ -119,7 +182,7 @@ class TargetStorage:
             failed = exc.value if exc.value else []
             return failed
 
-    @withlock
+    @withreadlock
     def location(self, target):
         """return target location"""
         if isinstance(self.memory, dict):
@@ -132,7 +195,30 @@ class TargetStorage:
     @withlock
     def write(self, target, data, mode=None, **kwargs):
         """Write to target"""
+        # callback
+        if self._write(target, data, mode) and self.on_write:
+            self.on_write(target, data, **kwargs)
 
+    def write_many(self, items, mode=None, **kwargs):
+        """Write sequence of (target, data) pairs
+
+        The storage is locked once, callbacks are called after writing
+        (including for the targets written before an error).
+        """
+        written = []
+        try:
+            with self.lock:
+                for target, data in items:
+                    if self._write(target, data, mode):
+                        written.append((target, data))
+        finally:
+            # callback
+            if self.on_write:
+                for target, data in written:
+                    self.on_write(target, data, **kwargs)
+
+    def _write(self, target, data, mode):
+        """write target (unlocked), return False if writing was skipped"""
         if not isinstance(target, Target):
             raise TypeError("Invalid target object: %s" % target)
 
@@ -152,7 +238,7 @@ class TargetStorage:
 
                 if is_same or mode == "test":
                     # skip
-                    return
+                    return False
                 # else 'upgrade': overwrite existing
 
             elif mode == "overwrite":
@@ -168,12 +254,29 @@ class TargetStorage:
         # write target (overwrite if necessary)
         LOGGER.info("writing target %s", target)
         self.memory[target] = data
+        if self.max_entries is not None:
+            self._evict(target)
+        return True
+
+    @withlock
+    def write_new(self, target, data, **kwargs):
+        """Write new target (same as `write` with mode=None, fewer checks)"""
+        if not isinstance(target, Target):
+            raise TypeError("Invalid target object: %s" % target)
+        elif target in self.memory:
+            # target exists: raise the relevant error
+            return self.write(target, data, **kwargs)
+
+        LOGGER.info("writing target %s", target)
+        self.memory[target] = data
+        if self.max_entries is not None:
+            self._evict(target)
 
         # callback
         if self.on_write:
             self.on_write(target, data, **kwargs)
 
-    @withlock
+    @withreadlock
     def read(self, target, **kwargs):
         """Read from target"""
         if not isinstance(target, Target):
@@ -187,7 +290,11 @@ class TargetStorage:
         try:
             # single target
             LOGGER.info("reading target %s", target)
-            return self.memory[target]
+            data = self.memory[target]
+            if self.max_entries is not None:
+                # mark as recently used
+                self.memory.move_to_end(target)
+            return data
 
         except KeyError:
             raise TargetDoesNotExist("Target %s does not exist" % str(target))
@@ -195,15 +302,42 @@ class TargetStorage:
     @withlock
     def copy(self, source, dest):
         """duplicate source target"""
-        if not self.exists(source):
+        if not isinstance(source, Target) or not isinstance(dest, Target):
+            raise TypeError("Invalid target objects: %s, %s" % (source, dest))
+        elif not source in self.memory:
             raise TargetDoesNotExist("Target %s does not exist" % source)
-        if self.exists(dest):
+        elif dest in self.memory:
             raise TargetAlreadyExists("Target %s already exists" % dest)
-        self.write(dest, self.read(source))
+
+        # read source
+        if self.on_read:
+            self.on_read(source)
+        data = self.memory[source]
+        if self.max_entries is not None:
+            self.memory.move_to_end(source)
+
+        # write destination
+        LOGGER.info("copying target %s to %s", source, dest)
+        self.memory[dest] = data
+        if self.max_entries is not None:
+            self._evict(dest)
+
+        # callback
+        if self.on_write:
+            self.on_write(dest, data)
 
     @withlock
     def remove(self, target):
         """remove target data"""
+        self._remove(target)
+
+    @withlock
+    def _remove_many(self, targets):
+        """remove several targets"""
+        for target in targets:
+            self._remove(target)
+
+    def _remove(self, target):
         if not isinstance(target, Target):
             raise TypeError("Invalid target object: %s" % target)
         elif target.name in self.target_lock:
@@ -222,21 +356,39 @@ class TargetStorage:
     @withlock
     def clear(self):
         """clear all memory"""
-        LOGGER.info("Clearing storage")
         targets = list(self.memory)
-        for target in targets:
-            self.remove(target)
+        locked = {target.name for target in targets if target.name in self.target_lock}
+        if locked:
+            raise TargetIsLocked("Targets '%s' are locked" % ", ".join(sorted(locked)))
+
+        LOGGER.info("Clearing storage (%d targets)", len(targets))
+        if isinstance(self.memory, dict):
+            self.memory.clear()
+        else:
+            for target in targets:
+                del self.memory[target]
+
+        # callback
+        if self.on_del:
+            for target in targets:
+                self.on_del(target)
         return targets
 
+    def _evict(self, target):
+        """remove least recently used targets beyond max_entries"""
+        self.memory.move_to_end(target)
+        while len(self.memory) > self.max_entries:
+            removed, _ = self.memory.popitem(last=False)
+            LOGGER.info("evicting target %s", removed)
+            if self.on_del:
+                self.on_del(removed)
+
     def _compare(self, target, data):
         """compare target with previous data value"""
         # load previous
         previous = self.read(target)
-        comparator = self.comparators.get(target.name)
-        if comparator:
-            return comparator(previous, data)
-        else:
-            return previous == data
+        comparator = self.comparators.get(target.name) or operator.eq
+        return comparator(previous, data)
 
     def cleanup(self, summary):
         """remove non-final targets from storage
@@ -248,47 +400,41 @@ class TargetStorage:
             return
 
         # process only finished tasks (done, skipped or error)
-        tasks = [
-            task
-            for task in summary
-            if task.status
-            in (Status.ERROR, Status.REJECTED, Status.SUCCESS, Status.SKIPPED)
-        ]
+        finished = (Status.ERROR, Status.REJECTED, Status.SUCCESS, Status.SKIPPED)
         all_targets = set()
-        keep_targets = set()
-        for task in tasks:
+        error_targets = set()
+        for task in summary:
+            if not task.status in finished:
+                continue
 
-            # select input targets that are stored here
+            # select input targets
             if task.aggregate:
                 # from an aggregating task
-                targets = set(
-                    target
-                    for targetlist in task.inputs
-                    for target in targetlist
-                    if self.exists(target)
-                )
+                targets = [
+                    target for targetlist in task.inputs for target in targetlist
+                ]
             else:
                 # from a normal task
-                targets = set(
-                    target for target in task.inputs if target and self.exists(target)
-                )
+                targets = [target for target in task.inputs if target]
 
-            if not targets:
-                continue
-
-            all_targets |= targets
+            all_targets.update(targets)
             if task.status == Status.ERROR:
                 # keep inputs targets if task had an error
-                keep_targets |= targets
+                error_targets.update(targets)
+
+        # input targets that are stored here
+        all_targets = self.contains_many(all_targets)
+        keep_targets = error_targets & all_targets
 
         # remove input targets whose task did not have an error
         remove_targets = all_targets - keep_targets
-        for target in remove_targets:
-            self.remove(target)
+        self._remove_many(remove_targets)
 
         nremove = len(remove_targets)
         nkeep = len(keep_targets)
-        LOGGER.info(f"Storage {self} cleaned-up. Removed: {nremove}, kept: {nkeep}")
+        LOGGER.info(
+            "Storage %s cleaned-up. Removed: %d, kept: %d", self, nremove, nkeep
+        )
 
 
 def MemoryStorage(**kwargs):
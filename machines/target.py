@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 """ targets """
 import re
+import sys
 import itertools
-from functools import total_ordering
+from functools import total_ordering, lru_cache, partial
 
 from .common import Identifier
 from .utils import id_repr, target_repr
@@ -12,9 +13,27 @@ from .utils import id_repr, target_repr
 RE_TARGET_STRING = ["+", "-", "_"]
 RE_TARGET_REGEX = re.compile(rf"^[\w{re.escape(''.join(RE_TARGET_STRING))}]+$")
 
+# target names already validated
+VALID_TARGET_NAMES = set()
+
 # authorized index/branch values
 RE_ID_STRING = ["+", "-", "_", ":", "(", ")"]
-RE_ID_REGEX = re.compile(rf"^[a-zA-Z0-9{re.escape(''.join(RE_ID_STRING))}]+$")
+RE_ID_CHARS = rf"[a-zA-Z0-9{re.escape(''.join(RE_ID_STRING))}]"
+RE_ID_REGEX = re.compile(rf"^{RE_ID_CHARS}+$", re.ASCII)
+
+# several values joined with "\x00"
+RE_IDS_REGEX = re.compile(rf"{RE_ID_CHARS}+(?:\x00{RE_ID_CHARS}+)*", re.ASCII)
+
+# bound match methods
+_target_ok = RE_TARGET_REGEX.match
+_id_ok = RE_ID_REGEX.match
+_ids_ok = RE_IDS_REGEX.fullmatch
+
+
+@lru_cache(maxsize=512)
+def compile_wildcard(pattern):
+    """compile pattern with '*' wildcards into a regex (cached)"""
+    return re.compile("^" + re.escape(pattern).replace(r"\*", ".*") + "$")
 
 
 def targets(name, ids, **kwargs):
@@ -28,6 +47,23 @@ def targets(name, ids, **kwargs):
 class Target:
     """Target class"""
 
+    __slots__ = (
+        "task",
+        "name",
+        "index",
+        "branch",
+        "_identifier",
+        "type",
+        "handler",
+        "version",
+        "temp",
+        "_attachment",
+        "_repr",
+        "_signature",
+        "_hash",
+        "_serialized",
+    )
+
     def __init__(
         self,
         name,
@@ -43,19 +79,25 @@ class Target:
         """Target object"""
         if not isinstance(name, str):
             raise TypeError("Invalid target's type: '%s'" % name)
-        elif not RE_TARGET_REGEX.match(name):
-            raise ValueError("Invalid target's name: '%s'" % name)
+        elif not name in VALID_TARGET_NAMES:
+            if not _target_ok(name):
+                raise ValueError("Invalid target's name: '%s'" % name)
+            VALID_TARGET_NAMES.add(name)
 
         # store task (may be None)
         self.task = task
 
-        # target's name
-        self.name = name
+        # target's name (interned: names are few and often compared)
+        self.name = sys.intern(name) if name.__class__ is str else name
 
         # target's identifiers
-        self.index = Index(index)
-        self.branch = Branch(branch)
-        self.identifier = Identifier(self.index.values, self.branch.values)
+        self.index = make_id(Index, index)
+        self.branch = make_id(Branch, branch)
+        self._identifier = None
+
+        # target's signature and hash (name and ids are not modified afterwards)
+        self._signature = (self.index, self.name, self.branch)
+        self._hash = hash(self._signature)
 
         # target's type (if needed)
         self.type = type
@@ -74,10 +116,23 @@ class Target:
         if attach:
             self.attach(attach)
 
+        # cached string representation (version, string)
+        self._repr = None
+
+        # cached serialized attributes
+        self._serialized = None
+
     @property
     def signature(self):
         """target's signature"""
-        return (self.index, self.name, self.branch)
+        return self._signature
+
+    @property
+    def identifier(self):
+        """target's (index, branch) identifier"""
+        if self._identifier is None:
+            self._identifier = Identifier(self.index.values, self.branch.values)
+        return self._identifier
 
     @property
     def attachment(self):
@@ -149,8 +204,7 @@ class Target:
     def match(self, name, index=None, branch=None):
         """return True if ids match input's"""
         if "*" in name:
-            regex = "^{}$".format(name.replace("*", ".*"))
-            if not re.search(regex, self.name):
+            if not compile_wildcard(name).match(self.name):
                 return False
         elif name != self.name:
             return False
@@ -163,11 +217,14 @@ class Target:
 
     def serialize(self):
         """return target attributes in a serializable format"""
-        return {
-            "name": self.name,
-            "index": self.index.values,
-            "branch": self.branch.values,
-        }
+        if self._serialized is None:
+            self._serialized = {
+                "name": self.name,
+                "index": self.index.values,
+                "branch": self.branch.values,
+            }
+        # copy: the returned dict may be modified
+        return dict(self._serialized)
 
     @classmethod
     def deserialize(cls, name, index, branch, **kwargs):
@@ -184,27 +241,52 @@ class Target:
 
     def __eq__(self, other):
         """check equality"""
-        return self.signature == other.signature
+        if self is other:
+            return True
+        return self._signature == other.signature
 
     def __ne__(self, other):
         """inequality"""
-        return self.signature != other.signature
+        return not self == other
 
     def __gt__(self, other):
-        return self.signature > other.signature
+        return self._signature > other.signature
+
+    def __lt__(self, other):
+        # (used by sorted: avoid total_ordering's __gt__ + __ne__ calls)
+        return self._signature < other.signature
 
     def __hash__(self):
         """target hash"""
-        return hash(self.signature)
+        return self._hash
+
+    def __getstate__(self):
+        """pickle target (slots)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        """unpickle target (string hashes may differ between processes)"""
+        for key, value in state.items():
+            setattr(self, key, value)
+        self._hash = hash(self._signature)
 
     def __repr__(self):
         """string representation"""
-        return self.to_string()
+        if self._repr is None or self._repr[0] != self.version:
+            # the version may be set after init
+            string = target_repr(
+                self.name, self.index, self.branch, version=self.version
+            )
+            self._repr = (self.version, string)
+        return self._repr[1]
 
     def to_string(self, **kwargs):
         """convert target to string
         options: sep1, sep2, noindex, nobranch, version
         """
+        if not kwargs:
+            # default representation (cached)
+            return repr(self)
         version = kwargs.pop("version", self.version)
         return target_repr(
             self.name, self.index, self.branch, version=version, **kwargs
@@ -221,63 +303,59 @@ class IdBase:
         (Id1, (Id1, Id2))
     """
 
+    __slots__ = ("_values",)
+
     allow_duplicate = False
     none_is_greater = True
 
     def __init__(self, *objs):
 
         cls = type(self)
-        single = len(objs) == 1
 
-        if not objs:
+        if len(objs) == 1:
+            # get values from object's type
+            obj = objs[0]
+            get_values = ID_VALUES_GETTERS.get(type(obj))
+            if get_values is None:
+                # subclasses
+                for types, getter in ID_VALUES_GETTERS.items():
+                    if isinstance(obj, types):
+                        get_values = getter
+                        break
+                else:
+                    get_values = _values_from_id
+            values = get_values(cls, obj)
+        elif not objs:
             # empty
             values = []
-        elif single and objs[0] is None:
-            # None
-            values = [None]
-        elif single and isinstance(objs[0], str):
-            # string
-            value = objs[0].strip()
-            values = [None] if not value else [value]
-        elif single and isinstance(objs[0], int):
-            # int -> convert to str
-            values = [str(objs[0])]
-        elif single and isinstance(objs[0], cls):
-            # if an item is already a IdBase
-            values = objs[0]._values
-        elif single and isinstance(objs[0], tuple) and not objs[0]:
-            # empty tuple
-            values = []
-        elif single and isinstance(objs[0], tuple) and bool(objs[0]):
-            # item is a non-empty tuple: check and concatenate values
-            values = [cls(item).values for item in objs[0]]
-        elif not single:
-            # check all values sequentially
-            values = [cls(obj).values for obj in objs]
         else:
-            raise TypeError("Invalid %s: %s" % (cls.__name__, str(objs)))
-
-        # check values
-        for value in values:
-            if isinstance(value, str) and not RE_ID_REGEX.match(value):
-                raise ValueError("Invalid value: %s" % str(value))
+            # check all values sequentially
+            values = _values_from_tuple(cls, objs)
+
+        # check values (all at once first)
+        strings = [value for value in values if isinstance(value, str)]
+        joined = "\x00".join(strings)
+        if strings and not (
+            _ids_ok(joined) and joined.count("\x00") == len(strings) - 1
+        ):
+            for value in strings:
+                if not _id_ok(value):
+                    raise ValueError("Invalid value: %s" % str(value))
 
         # check duplicates
         if not self.allow_duplicate:
-            # remove duplicate
-            valueset = set()
-            values = [
-                value
-                for value in values
-                if not (value in valueset or valueset.add(value))
-            ]
-
-        if len(values) > 1 and None in values:
-            raise ValueError(
-                "Multi-valued %s must not contain null values: %s"
-                % (cls.__name__, values)
-            )
-        self._values = tuple(value for value in values if value is not None)
+            # remove duplicate (keep order)
+            values = dict.fromkeys(values)
+
+        if None in values:
+            if len(values) > 1:
+                raise ValueError(
+                    "Multi-valued %s must not contain null values: %s"
+                    % (cls.__name__, list(values))
+                )
+            # single null value
+            values = ()
+        self._values = tuple(values)
 
     @property
     def values(self):
@@ -305,17 +383,21 @@ class IdBase:
             return not other
         elif not other:
             return False
+        elif type(other) is str and not "*" in other:
+            # plain value: no regex needed
+            return "___".join(self) == other
 
-        cls = type(self)
         if not isinstance(other, tuple):
             other = (other,)
 
         # join and compare
         str_self = "___".join(self)
         str_other = "___".join(other)
+        if not "*" in str_other:
+            # no wildcard: plain comparison
+            return str_self == str_other
 
-        regex = "^{}$".format(str_other.replace("*", ".*"))
-        if not re.match(regex, str_self):
+        if not compile_wildcard(str_other).match(str_self):
             return False
 
         return True
@@ -360,15 +442,13 @@ class IdBase:
             return not self.none_is_greater
         elif self.values is None:
             return self.none_is_greater
-        else:
-            for a, b in itertools.zip_longest(
-                self._values, other._values, fillvalue=""
-            ):
-                if a > b:
-                    return True
-                elif a < b:
-                    return False
-            return False
+        values, others = self._values, other._values
+        if len(values) != len(others):
+            # pad shorter values with ""
+            num = max(len(values), len(others))
+            values += ("",) * (num - len(values))
+            others += ("",) * (num - len(others))
+        return values > others
 
     def __iter__(self):
         return iter(self._values)
@@ -382,22 +462,97 @@ class IdBase:
     def __hash__(self):
         return hash(self._values)
 
+    def __getstate__(self):
+        # (non-empty state, even for empty ids)
+        return {"_values": self._values}
+
+    def __setstate__(self, state):
+        self._values = state["_values"]
+
+
+def _values_from_none(cls, obj):
+    return [None]
+
+
+def _values_from_str(cls, obj):
+    value = obj.strip()
+    return [None] if not value else [sys.intern(value)]
+
+
+def _values_from_int(cls, obj):
+    # int -> convert to str
+    return [sys.intern(str(obj))]
+
+
+def _values_from_tuple(cls, obj):
+    # check and concatenate values (empty if tuple is empty)
+    values = []
+    for item in obj:
+        get_values = ID_VALUES_GETTERS.get(type(item))
+        if get_values is None or get_values is _values_from_tuple:
+            # sub-ids and other objects: keep nested values
+            values.append(cls(item).values)
+        else:
+            # single value: no intermediary IdBase
+            values.extend(get_values(cls, item))
+    return values
+
+
+def _values_from_id(cls, obj):
+    # if an item is already a IdBase
+    if not isinstance(obj, cls):
+        raise TypeError("Invalid %s: %s" % (cls.__name__, str((obj,))))
+    return obj._values
+
+
+# IdBase values, by object type
+ID_VALUES_GETTERS = {
+    type(None): _values_from_none,
+    str: _values_from_str,
+    int: _values_from_int,
+    tuple: _values_from_tuple,
+}
+
 
 class Index(IdBase):
     """task's index version of the identifier class"""
 
+    __slots__ = ()
+
     allow_duplicate = True
 
 
 class Branch(IdBase):
     """task's branch version of the identifier class"""
 
+    __slots__ = ()
+
     none_is_greater = False
 
     def __add__(self, other):
         cls = type(self)
         other = cls(other)._values
-        return cls(self._values + tuple(v for v in other if not v in self._values))
+        existing = set(self._values)
+        return cls(self._values + tuple(v for v in other if not v in existing))
+
+
+def make_id(cls, obj):
+    """return Index/Branch object (reuse instances for common values)"""
+    if type(obj) is cls:
+        # immutable
+        return obj
+    elif obj is None or type(obj) is str:
+        return _make_id_cached(cls, obj)
+    return cls(obj)
+
+
+@lru_cache(maxsize=4096)
+def _make_id_cached(cls, obj):
+    return cls(obj)
+
+
+# build Identifier from an (index, branch) pair without calling Identifier.__new__
+_new_identifier = partial(tuple.__new__, Identifier)
 
 
 def ravel_identifiers(indices=None, branches=None):
@@ -408,10 +563,10 @@ def ravel_identifiers(indices=None, branches=None):
         branches = [branches]
 
     if (len(indices) == 1) or (len(branches) == 1):
-        return [Identifier(*id) for id in itertools.product(indices, branches)]
+        return list(map(_new_identifier, itertools.product(indices, branches)))
 
     elif len(indices) == len(branches):
-        return [Identifier(*id) for id in zip(indices, branches)]
+        return list(map(_new_identifier, zip(indices, branches)))
 
     else:
         raise ValueError("Incompatible numbers of indices and branches")
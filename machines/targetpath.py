@@ -4,8 +4,8 @@
 import os
 import re
 import pathlib
-import glob
 import datetime
+from functools import lru_cache
 from itertools import cycle
 from .target import Target, Branch, RE_ID_STRING, RE_TARGET_STRING
 from .common import SEP_1, SEP_2, SEP_FLAT, SEP_DIR
@@ -42,6 +42,52 @@ TARGETDIR_EXPR = {
 class TargetConverter:
     """target to path converter"""
 
+    # memoize conversions (disable if they depend on external state)
+    memoize = True
+    max_cache_size = 1024
+
+    # number of round-trip checks after which checks are skipped
+    # (None: always check; only set for converters known to be consistent)
+    check_threshold = None
+
+    def _checks_skipped(self):
+        """return True if the check threshold was reached"""
+        if self.check_threshold is None:
+            return False
+        return self.__dict__.get("_checks_done", 0) >= self.check_threshold
+
+    def _check_roundtrip(self):
+        """return True if the round-trip conversion must be checked"""
+        if self._checks_skipped():
+            return False
+        elif self.check_threshold is not None:
+            self._checks_done = self.__dict__.get("_checks_done", 0) + 1
+        return True
+
+    def _get_cached(self, cache, key, check):
+        """return memoized conversion or None
+
+        Unchecked conversions are only returned if no check is required.
+        """
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        value, checked = cached
+        if checked or not check or self._checks_skipped():
+            return value
+        return None
+
+    def _set_cached(self, cache, key, value, checked):
+        """memoize conversion"""
+        if len(cache) >= self.max_cache_size:
+            cache.clear()
+        cache[key] = (value, checked)
+
+    def clear_cache(self):
+        """clear memoized conversions"""
+        self.__dict__.pop("_to_path_cache", None)
+        self.__dict__.pop("_from_path_cache", None)
+
     def _to_path(self, target, new=False):
         pass
 
@@ -53,17 +99,36 @@ class TargetConverter:
         if not isinstance(target, Target):
             raise TypeError()
 
+        if self.memoize:
+            # (caches are created here: subclasses may not call __init__)
+            cache = self.__dict__.setdefault("_to_path_cache", {})
+            key = (target.signature, target.version, new)
+            path = self._get_cached(cache, key, check)
+            if path is not None:
+                return path
+
         # get path
         path = self._to_path(target, new=new)
 
         # check convert and back
-        if check and self._from_path(path) != target:
+        checked = check and self._check_roundtrip()
+        if checked and self._from_path(path) != target:
             raise ValueError(f"Invalid target: '{target}'")
 
-        return os.path.normpath(path)
+        path = os.path.normpath(path)
+        if self.memoize:
+            self._set_cached(cache, key, path, checked)
+        return path
 
     def from_path(self, path, check=True):
         """converter path to target"""
+        if self.memoize:
+            cache = self.__dict__.setdefault("_from_path_cache", {})
+            target = self._get_cached(cache, path, check)
+            if target is not None:
+                # return a copy (targets can be modified)
+                return target.copy()
+            key = path
 
         # normalize path
         path = "/".join(pathlib.Path(path).parts)
@@ -77,10 +142,15 @@ class TargetConverter:
             raise TypeError()
 
         # check convert and back
-        if check and self._to_path(target) != path:
+        checked = check and self._check_roundtrip()
+        if checked and self._to_path(target) != path:
             raise ValueError("Invalid path: '%s'" % path)
+
+        if self.memoize:
+            self._set_cached(cache, key, target.copy(), checked)
         return target
 
+
 # deprecated
 class TargetToPath(TargetConverter):
     """standard target to path converter
@@ -130,18 +200,14 @@ class TargetToPath(TargetConverter):
         """convert path to target"""
 
         # split path with main separator
-        if not self.sep_main in path:
+        head, sep, tail = path.rpartition(self.sep_main)
+        if not sep:
             raise ValueError(
                 f"Main seperator ('{self.sep_main}') not found in path: {path}"
             )
-        head, tail = path.rsplit(self.sep_main, 1)
 
         # split secondary separator
-        if self.sep_sec in tail:
-            name, tail = tail.split(self.sep_sec, 1)
-        else:
-            name = tail
-            tail = ""
+        name, _, tail = tail.partition(self.sep_sec)
 
         # index
         if head == PATH_NONE:
@@ -176,22 +242,35 @@ class VersionerInt:
         return str(value)
 
 
+# date version format
+DATE_VERSION_FORMAT = "%Y%m%d_%H%M%S.%f"
+
+
+@lru_cache(maxsize=4096)
+def parse_date_version(value):
+    """parse date version (cached: strptime is slow)"""
+    return datetime.datetime.strptime(value, DATE_VERSION_FORMAT)
+
+
 class VersionerDate:
     """basic versioner for date versions"""
 
     def to_version(self, value):
-        return datetime.datetime.strptime(value, "%Y%m%d_%H%M%S.%f")
+        return parse_date_version(value)
 
     def new_version(self, previous=None):
         return datetime.datetime.now()
 
     def from_version(self, value):
-        return value.strftime("%Y%m%d_%H%M%S.%f")
+        return value.strftime(DATE_VERSION_FORMAT)
 
 # deprecated
 class TargetToPathWithVersion(TargetToPath):
     """TargetToPath with target version"""
 
+    # paths depend on the existing versions
+    memoize = False
+
     def __init__(self, root, versioner=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.root = root
@@ -223,10 +302,21 @@ class TargetToPathWithVersion(TargetToPath):
 
     def _get_last_version(self, path):
         """get last version of target"""
-        existing = glob.glob(os.path.join(self.root, path + "_v*"))
-        if not existing:
+        parent, basename = os.path.split(os.path.join(self.root, path))
+        prefix = basename + "_v"
+        try:
+            entries = os.scandir(parent or ".")
+        except OSError:
+            # missing directory
+            return None
+        with entries:
+            versions = [
+                entry.name.rsplit("_v", 1)[1]
+                for entry in entries
+                if entry.name.startswith(prefix)
+            ]
+        if not versions:
             return None
-        versions = [path.rsplit("_v", 1)[1] for path in existing]
         # return last version
         return max([self.versioner.to_version(v) for v in versions])
 
@@ -286,11 +376,7 @@ class TargetToPathDedicated(TargetConverter):
     def _from_path(self, path):
         """convert path to target"""
         # split secondary separator
-        if self.sep_sec in path:
-            head, tail = path.split(self.sep_sec, 1)
-        else:
-            head = path
-            tail = ""
+        head, _, tail = path.partition(self.sep_sec)
 
         # index
         if head == PATH_NONE:
@@ -352,6 +438,23 @@ class TargetToPathExpr(TargetConverter):
         self.branch = IdToPathExpr(branch, nobranch, values=values)
         self.default_branch = default_branch
 
+        # path regex
+        regindex = rf"(?P<index>{re.escape(self.index.prefix)}.+?{re.escape(self.index.suffix)}|{re.escape(self.index.noid)})"
+        regbranch = rf"(?P<branch>{re.escape(self.branch.prefix)}.+?{re.escape(self.branch.suffix)}|{re.escape(self.branch.noid)})"
+
+        nameexpr = rf"[0-9a-zA-Z{re.escape(''.join(self.targetchars))}]+?"
+        regname = rf"(?P<name>{self.name if self.name else nameexpr})"
+        regex = (
+            self.struct.replace("<index>", regindex)
+            .replace("<name>", regname)
+            .replace("<branch>", regbranch)
+            + r"$"
+        )
+        self._path_re = re.compile(regex)
+
+        # literal segments and fields, for to_path
+        self._struct_parts = tuple(re.split(r"(<index>|<name>|<branch>)", struct))
+
     def __repr__(self):
         return f"struct={self.struct};index={self.index};branch={self.branch};name={self.name}"
 
@@ -368,27 +471,11 @@ class TargetToPathExpr(TargetConverter):
         else:
             branch = self.branch.to_path(target.branch)
 
-        path = (
-            self.struct.replace("<name>", target.name)
-            .replace("<index>", index)
-            .replace("<branch>", branch)
-        )
-        return path
+        fields = {"<name>": target.name, "<index>": index, "<branch>": branch}
+        return "".join([fields.get(part, part) for part in self._struct_parts])
 
     def _from_path(self, path, **kwargs):
-
-        regindex = rf"(?P<index>{re.escape(self.index.prefix)}.+?{re.escape(self.index.suffix)}|{re.escape(self.index.noid)})"
-        regbranch = rf"(?P<branch>{re.escape(self.branch.prefix)}.+?{re.escape(self.branch.suffix)}|{re.escape(self.branch.noid)})"
-
-        nameexpr = rf"[0-9a-zA-Z{re.escape(''.join(self.targetchars))}]+?"
-        regname = rf"(?P<name>{self.name if self.name else nameexpr})"
-        regex = (
-            self.struct.replace("<index>", regindex)
-            .replace("<name>", regname)
-            .replace("<branch>", regbranch)
-            + r"$"
-        )
-        match = re.match(regex, path)
+        match = self._path_re.match(path)
         if not match:
             raise ValueError(f"Invalid path structure: {path}")
 
@@ -475,13 +562,38 @@ class IdToPathExpr:
         else:
             raise ValueError(f"Invalid expression: {expr}")
 
+        # authorized id characters expression
+        self._idexpr = rf"[a-zA-Z0-9{re.escape(''.join(self.idchars))}]"
+
+        # literal segments and placeholder names (odd items) for to_path
+        self._head_parts = tuple(self.regex_part.split(self.head_str))
+        self._tail_parts = tuple(self.regex_part.split(self.tail_str))
+        if self.gen_str:
+            self._gen_parts = self.gen_str.partition(f"<{self.gen_vals[0]}>")
+
+        # compile head, tail and generative regexes
+        head_expr = "^" + re.escape(self.head_str)
+        for name in self.head_vals:
+            head_expr = head_expr.replace(f"<{name}>", rf"({self._idexpr}+)")
+        self._head_re = re.compile(head_expr)
+
+        tail_expr = re.escape(self.tail_str) + "$"
+        for name in self.tail_vals:
+            tail_expr = tail_expr.replace(f"<{name}>", rf"({self._idexpr}+)")
+        self._tail_re = re.compile(tail_expr)
+
+        gen_expr = re.escape(self.gen_str)
+        for name in self.gen_vals:
+            gen_expr = gen_expr.replace(f"<{name}>", rf"({self._idexpr}+)")
+        self._gen_re = re.compile(gen_expr)
+
     def __repr__(self):
         return self.expr
 
     @property
     def idexpr(self):
         """get authorized index characters"""
-        return rf"[a-zA-Z0-9{re.escape(''.join(self.idchars))}]"
+        return self._idexpr
 
     def _validate(self, name, value):
         """validate id value"""
@@ -521,76 +633,75 @@ class IdToPathExpr:
             raise ValueError(f"Invalid id length: {id} < {id_len})")
 
         # head
-        head_str = self.head_str
-        for value, name in zip(id, self.head_vals):
-            if validate:
+        head = id[:nhead]
+        if validate:
+            for value, name in zip(head, self.head_vals):
                 self._validate(name, value)
-            head_str = head_str.replace(f"<{name}>", value, 1)
+        parts = list(self._head_parts)
+        parts[1::2] = head
 
         # generative
-        gen_str = ""
-        for value in id[nhead : -ntail if ntail else None]:
-            gen_str += self.gen_str
-            for name in self.gen_vals:
+        if self.gen_str:
+            before, _, after = self._gen_parts
+            for value in id[nhead : -ntail if ntail else None]:
                 if validate:
-                    self._validate(name, value)
-                gen_str = gen_str.replace(f"<{name}>", value, 1)
+                    for name in self.gen_vals:
+                        self._validate(name, value)
+                parts.extend((before, value, after))
 
         # tail
-        tail_str = self.tail_str
-        for value, name in zip(id[-ntail:], self.tail_vals):
-            if validate:
+        tail = id[-ntail:] if ntail else ()
+        if validate:
+            for value, name in zip(tail, self.tail_vals):
                 self._validate(name, value)
-            tail_str = tail_str.replace(f"<{name}>", value, 1)
+        tail_parts = list(self._tail_parts)
+        tail_parts[1::2] = tail
+        parts.extend(tail_parts)
 
-        str_id = head_str + gen_str + tail_str
-        return str_id
+        return "".join(parts)
 
     def from_path(self, path, validate=True):
         if path == self.noid:
             return None
 
         # head
-        head_expr = "^" + re.escape(self.head_str)
-        for name in self.head_vals:
-            head_expr = head_expr.replace(f"<{name}>", rf"({self.idexpr}+)")
-        head_match = re.search(head_expr, path)
+        head_match = self._head_re.search(path)
         if not head_match:
             raise ValueError(f"Cannot parse path: {path}")
         head = list(head_match.groups())
         if validate:
             for name, value in zip(self.head_vals, head):
                 self._validate(name, value)
-        remain = path[head_match.end() :]
+
+        if not self.gen_str:
+            # fixed length: the head is the whole path
+            if head_match.end() != len(path):
+                raise ValueError(f"Invalid path: {path}")
+            return tuple(head)
+        start = head_match.end()
 
         # tail
-        tail_expr = re.escape(self.tail_str) + "$"
-        for name in self.tail_vals:
-            tail_expr = tail_expr.replace(f"<{name}>", rf"({self.idexpr}+)")
-        tail_match = re.search(tail_expr, remain)
+        tail_match = self._tail_re.search(path, start)
         if not tail_match:
             raise ValueError(f"Cannot parse path: {path}")
         tail = list(tail_match.groups())
         if validate:
             for name, value in zip(self.tail_vals, tail):
                 self._validate(name, value)
-        remain = remain[: tail_match.start()]
-
-        # generative
-        gen_expr = self.gen_str.replace(".", r"\.").replace("+", r"\+")
-        for name in self.gen_vals:
-            gen_expr = gen_expr.replace(f"<{name}>", rf"({self.idexpr}+)")
+        end = tail_match.start()
 
+        # generative (search between head and tail, without slicing)
         mid = []
-        while remain:
-            gen_match = re.search(gen_expr, remain)
+        pos = start
+        while pos < end:
+            gen_match = self._gen_re.search(path, pos, end)
             if not gen_match:
                 raise ValueError(f"Cannot parse path: {path}")
             try:
                 mid.append(gen_match.group(1))
             except IndexError:
                 raise ValueError(f"Invalid path: {path}")
-            remain = remain[gen_match.end() :]
+            pos = gen_match.end()
         if validate:
             names = cycle(self.gen_vals)
             for value in mid:
@@ -110,7 +110,7 @@ class Task:
     def _solve_parameters(self, parameters):
         """parse passed parameters"""
         try:
-            return solve_parameters(self.machine.all_parameters, parameters)
+            return solve_parameters(self.machine.parameter_plan(), parameters)
         except ParameterError as exc:
             raise ParameterError(f"{self}: {exc}")
 
@@ -321,7 +321,7 @@ class Task:
                         target = input.target(index, branch)
 
                         if self.factory.exists(target):
-                            LOGGER.info(f"{self}: found target {target}")
+                            LOGGER.info("%s: found target %s", self, target)
                             targets[name] = target
                             break
                     else:
@@ -506,10 +506,10 @@ class Task:
 
             elif not self.ready():
                 # check if task ready
-                LOGGER.info("Task %s not ready, pending" % str(self))
+                LOGGER.info("Task %s not ready, pending", self)
                 return update_status(Status.PENDING)
 
-            LOGGER.info("Task %s: running" % str(self))
+            LOGGER.info("Task %s: running", self)
             update_status(Status.RUNNING)
 
         # setup context
@@ -549,13 +549,13 @@ class Task:
             except Exception as exc:
                 # error at writing
                 tb = traceback.format_exc()
-                LOGGER.info("Task %s: an error occured while writing output" % self)
+                LOGGER.info("Task %s: an error occured while writing output", self)
                 LOGGER.info(tb)
                 self.error = (str(exc), str(tb))
                 return update_status(Status.ERROR, exc)
 
         # success
-        LOGGER.info("Task %s: done" % str(self))
+        LOGGER.info("Task %s: done", self)
         return update_status(Status.SUCCESS)
 
 
@@ -37,6 +37,7 @@ class Toolbox:
         self.initializers = []
         self.comparators = {}  # store data comparators here for convenience
         self.signature = None
+        self.version = 0  # incremented when programs change
 
     @property
     def machines(self):
@@ -70,6 +71,7 @@ class Toolbox:
         else:
             raise TypeError(f"Invalid machine: {machine}")
         self.programs[name] = machine
+        self.version += 1
 
     def add_program(self, name, machine, help=None, manual=None, meta=None, group=None):
         """add a new machine (or sequence of) to the box"""
@@ -99,6 +101,7 @@ class Toolbox:
             programs = [programs]
         for prog in programs:
             self.programs.pop(prog)
+            self.version += 1
             self.programs_help.pop(prog)
             self.programs_manual.pop(prog)
             self.meta.pop(prog, None)
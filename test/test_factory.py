@@ -205,6 +205,19 @@ def test_factory_manager():
         tasks = SomeMachine()
     assert foobar == "foobar"
 
+    # callback reading the factory's tasks (must not deadlock)
+    ntasks = []
+
+    def run():
+        with factory(hold=True, callback=lambda s: ntasks.append(len(fy.tasks))) as fy:
+            SomeMachine()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert ntasks == [1]
+
     # default workdir
     with tempfile.TemporaryDirectory() as tmpdir:
         with factory(root=tmpdir) as fy:
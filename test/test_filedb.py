@@ -5,6 +5,7 @@ import os
 import datetime
 import shutil
 import json
+import pathlib
 import pytest
 from machines.target import Target, Index, Branch
 from machines import filedb
@@ -86,6 +87,11 @@ def test_filedb(tmpdir):
     assert root.join("id3", "name3~branch3").exists()
     assert root.join("id41.id42", "name4~branch41.branch42").exists()
 
+    # unparsable pathes
+    root.join("invalid id", "name").ensure("data")
+    assert db.failed() == [pathlib.Path(root.join("invalid id", "name"))]
+    assert len(list(db)) == 4
+
     # wrong keys
     with pytest.raises(KeyError):
         db[Target("unknown_target")]
@@ -112,6 +112,23 @@ def test_machine_class():
     machine6_2 = machine6.copy()
     machine6_2.set_input("A", Input("A1"), replace=True)
     assert machine6_2.inputs == {"A": [Input("A1")]}
+    assert machine6.inputs == {"A": [Input(...)]}  # unchanged
+
+    # copy with already parsed i/os
+    machine6_3 = machine6.copy(
+        inputs={"A": [Input("A2")]}, outputs={"B": [Output("B")]}
+    )
+    assert machine6_3.inputs == {"A": [Input("A2")]}
+    assert machine6_3.outputs == {"B": [Output("B")]}
+    with pytest.raises(ValueError):
+        # multiple outputs
+        machine6.copy(outputs={"B": [Output("B1"), Output("B2")]})
+    with pytest.raises(TypeError):
+        # parsed inputs of the wrong type
+        Machine(lambda A: None, _parsed_inputs={"A": ["A1"]})
+    with pytest.raises(TypeError):
+        # parsed outputs of the wrong type
+        Machine(lambda A: None, inputs="A", _parsed_outputs={"B": [Index("B")]})
 
     # test argument validity
 
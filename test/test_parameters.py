@@ -66,6 +66,38 @@ def test_config_class(tmpdir):
     assert config("preset1").filename == tmpdir / "preset1.yml"
     assert config(tmpdir / "preset1.yml").filename == tmpdir / "preset1.yml"
 
+    # config files are passed through
+    cfg = config("preset1")
+    assert config(cfg) is cfg
+    assert config({"a": "foobaz"}).filename is None
+
+    # modified file is parsed again
+    preset1["a"] = "foobaz!"
+    with open(tmpdir / "preset1.yml", "w") as fp:
+        yaml.dump(preset1, fp)
+    assert config("preset1") == preset1
+
+    # cached parsing: nested values are not shared
+    config("a: {b: 1}")["a"]["b"] = 2
+    assert config("a: {b: 1}") == {"a": {"b": 1}}
+    with open(tmpdir / "preset2.yml", "w") as fp:
+        yaml.dump({"a": [1]}, fp)
+    config(tmpdir / "preset2.yml")["a"].append(2)
+    assert config(tmpdir / "preset2.yml") == {"a": [1]}
+
+    # json files are parsed as json first
+    with open(tmpdir / "preset3.json", "w") as fp:
+        fp.write('{"a": 1e3}')
+    assert config(tmpdir / "preset3.json") == {"a": 1000.0}
+    assert config('{"a": 1e3}') == {"a": "1e3"}  # YAML first
+
+    # overridden parse method is used
+    class MyConfig(parameters.Config):
+        def parse(self, string):
+            return {"parsed": string}
+
+    assert MyConfig()("a: 1") == {"parsed": "a: 1"}
+
     with pytest.raises(parameters.ParameterError):
         config("wrong")
     with pytest.raises(parameters.ParameterError):
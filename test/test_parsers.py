@@ -81,6 +81,14 @@ def test_parse_identifiers():
         Id(("id1", "id2"), ("br1", "br2")),
     }  # (ignore no-index ids)
 
+    # update identifiers
+    parser.update_identifiers([Id("id3", None)])
+    assert set(parser.parse_identifiers("id*~")) == {
+        Id("id1", None),
+        Id("id2", None),
+        Id("id3", None),
+    }
+
 
 def test_parse_targets():
 
@@ -351,6 +359,28 @@ def test_parse_batch_2():
     assert len(tasks) == 1
     assert tasks[0]["task"] == "task2"
 
+    # conditions cannot access the parser's module
+    batch = yaml.safe_load(
+        """
+    !task task1:
+        inputs: id1
+        !program prog1:
+            !macro CONDITION: os.sep
+    """
+    )
+    with pytest.raises(NameError):
+        parse_batch(batch, parser, programs)
+
+    # subclasses of the yaml tags
+    class MyProgram(parsers.YAMLProgram):
+        pass
+
+    task = {"inputs": "id1", MyProgram("prog1"): {"param1": "A"}}
+    tasks, _ = parse_batch({parsers.YAMLTask("task1"): task}, parser, programs)
+    assert len(tasks) == 1
+    assert tasks[0]["program"] == "prog1"
+    assert tasks[0]["parameters"] == {"param1": "A"}
+
 
 def test_batch_templates():
     template = {
@@ -394,3 +424,7 @@ def test_batch_templates():
         "task~complex1": {"param1": [1, 2], "param2": {3: 4}},
         "task~complex2": {"param1": [1, 2], "param2": {5: 6}},
     }
+
+    # templates in lists
+    assert parsers.is_template({"task": {"param": ["a", "<b>"]}})
+    assert not parsers.is_template({"task": {"param": ["a", "b"]}})
@@ -265,6 +265,7 @@ def test_session_autorun():
     assert len(tasks) == 3
     assert all(task.status.name == "SUCCESS" for task in tasks)
     assert storage.read(Target("C", "id1")) == "foofoobaz"
+    assert session.get_parents("progC") == [MachineC, MachineA, MachineB]
 
     # session.monitor
     summary = session.monitor()
@@ -416,3 +417,8 @@ def test_setup_storage(tmpdir):
         Target("B", "id3"),
         Target("C", "id3"),
     }
+
+    # selected storages are returned in session order
+    names = [storage.name for storage in session.storages]
+    selected = session.summary(storages=names[::-1])
+    assert [storage.name for storage in selected] == names
@@ -32,10 +32,18 @@ def _check_storage(storage):
     # test write
     storage.write(target, "data")
     assert storage.exists(target)
+    assert storage.contains_many([target, Target("name", "other")]) == {target}
+    with pytest.raises(TypeError):
+        storage.contains_many([target, "name"])
+    assert list(storage.iter_targets()) == [target]
 
     # test no overwrite
     with pytest.raises(TargetAlreadyExists):
         storage.write(target, "data 2")
+    with pytest.raises(TargetAlreadyExists):
+        storage.write_new(target, "data 2")
+    with pytest.raises(TypeError):
+        storage.write_new("name", "data 2")
 
     # test not exist
     with pytest.raises(TargetDoesNotExist):
@@ -105,6 +113,35 @@ def test_target_storage_class():
     storage = TargetStorage()
     _check_storage(storage)
 
+    # no locking
+    _check_storage(TargetStorage(thread_safe=False))
+
+    # write many targets
+    storage = TargetStorage()
+    storage.write_many([(Target("A"), "a"), (Target("B"), "b")])
+    assert storage.read(Target("B")) == "b"
+    storage.write_many([(Target("A"), "a"), (Target("B"), "c")], mode="upgrade")
+    assert storage.read(Target("B")) == "c"
+
+    # callbacks are called for targets written before an error
+    written = []
+    storage = TargetStorage(on_write=lambda target, data: written.append(target))
+    storage.write(Target("B"), "b")
+    with pytest.raises(TargetAlreadyExists):
+        storage.write_many([(Target("A"), "a"), (Target("B"), "b"), (Target("C"), "c")])
+    assert written == [Target("B"), Target("A")]
+    assert not storage.exists(Target("C"))
+
+    # max entries
+    storage = TargetStorage(temporary=True, max_entries=2)
+    storage.write(Target("A"), "a")
+    storage.write(Target("B"), "b")
+    storage.read(Target("A"))
+    storage.write(Target("C"), "c")
+    assert set(storage.list()) == {Target("A"), Target("C")}
+    with pytest.raises(ValueError):
+        TargetStorage(max_entries=2)
+
 
 def test_file_storage_class(tmpdir):
     """test file storage class"""
@@ -265,6 +302,11 @@ def test_storage_lock():
     with pytest.raises(TargetIsLocked):
         storage.write(Target("A"), "data2", mode="test")
 
+    # nothing is removed if a target is locked
+    with pytest.raises(TargetIsLocked):
+        storage.clear()
+    assert set(storage.list()) == {Target("A"), Target("B")}
+
 
 def test_storage_test(tmpdir):
     storage = TargetStorage()
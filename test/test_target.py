@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """ test targets and identifiers """
 import json
+import pickle
 import pytest
 from machines.target import Target, IdBase, Index, Branch, ravel_identifiers
 
@@ -106,6 +107,14 @@ def test_identifier():
     with pytest.raises(ValueError):
         IdBase(1, (None, 2))
 
+    with pytest.raises(ValueError):
+        # invalid character in one of several values
+        IdBase("a", "b c")
+
+    with pytest.raises(ValueError):
+        # separator used for batch validation
+        IdBase("a", "b\x00c")
+
     # id match
     assert IdBase(None).match(None)
     assert IdBase(None).match("")
@@ -239,6 +248,12 @@ def test_target_class():
     assert target2.branch == Branch("br")
     assert target2.type == "test"
 
+    # test string representation
+    target = Target("name", "id", "br")
+    assert str(target) == "id#name~br"
+    target.version = "v1"
+    assert str(target) == "id#name~br(vv1)"
+
     # test serialize
     target3 = Target("name", ("id1", ("id2", "id3")), ("br1", ("br2", "br3")))
     serialized = json.dumps(target3.serialize())
@@ -279,6 +294,24 @@ def test_target_class():
     assert Target("B", "id1", "br1") > Target("A", "id1", "br2")
 
 
+def test_target_pickle():
+    """test pickling targets (all protocols)"""
+    target = Target("name", ("id1", ("id2", "id3")), "br1", attach={"a": 1})
+    target.version = "v1"
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copy = pickle.loads(pickle.dumps(target, protocol=protocol))
+        assert copy == target
+        assert hash(copy) == hash(target)
+        assert repr(copy) == repr(target)
+        assert copy.attachment == {"a": 1}
+        assert pickle.loads(pickle.dumps(Index(), protocol=protocol)) == Index()
+
+    # hash is recomputed (string hashes differ between processes)
+    target._hash = 0
+    copy = pickle.loads(pickle.dumps(target))
+    assert hash(copy) == hash(Target("name", ("id1", ("id2", "id3")), "br1"))
+
+
 def test_ravel_indices():
 
     indices = ravel_identifiers()
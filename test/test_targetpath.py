@@ -246,6 +246,11 @@ def test_id_path_expr():
         conv.to_path(("any", "foo", "wrong", "baz"))
     assert conv.to_path(("any", "wrong", "wrong"), validate=False) == "any.wrong/wrong"
 
+    # regex characters in generative part
+    conv = IdToPathExpr("<id>[(<id>)]")
+    assert conv.to_path(("a", "b", "c")) == "a(b)(c)"
+    assert conv.from_path("a(b)(c)") == ("a", "b", "c")
+
 
 def test_target_path_expr():
 
@@ -405,3 +410,62 @@ def test_target_path_expr():
     assert conv.from_path(path) == target
     with pytest.raises(ValueError):
         conv.to_path(Target("name", "id1_id2"))  # underscore in index is forbidden now
+
+    # memoized conversions
+    conv = TargetToPathExpr()
+    target = Target("name", "id1", "br1")
+    assert conv.to_path(target) == conv.to_path(target) == join("id1", "name~br1")
+    target1 = conv.from_path(join("id1", "name~br1"))
+    target2 = conv.from_path(join("id1", "name~br1"))
+    assert target1 == target2 == target
+    assert target1 is not target2
+    conv.clear_cache()
+    assert conv.from_path(join("id1", "name~br1")) == target
+
+    # subclass not calling TargetConverter.__init__
+    class MyConverter(TargetConverter):
+        def __init__(self, prefix):
+            self.prefix = prefix
+
+        def _to_path(self, target, new=False):
+            return self.prefix + target.name
+
+        def _from_path(self, path):
+            return Target(path[len(self.prefix) :])
+
+    conv = MyConverter("my_")
+    assert conv.to_path(Target("name")) == conv.to_path(Target("name")) == "my_name"
+    assert conv.from_path("my_name") == conv.from_path("my_name") == Target("name")
+
+    # skip checks after threshold
+    conv = TargetToPathExpr()
+    conv.check_threshold = 1
+    with pytest.raises(ValueError):
+        conv.from_path(join("id1", "name~br1.br1"))
+    assert conv.from_path(join("id1", "name~br1.br1")) == target
+    assert conv.from_path(join("id2", "name")) == Target("name", "id2")
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("not memoized")
+
+    # conversions are memoized past the threshold
+    conv._from_path = conv._to_path = fail
+    assert conv.from_path(join("id2", "name")) == Target("name", "id2")
+    assert conv.from_path(join("id1", "name~br1.br1")) == target
+
+    # unchecked conversions are not used when a check is required
+    conv = TargetToPathExpr()
+    assert conv.to_path(target, check=False) == join("id1", "name~br1")
+    conv._from_path = conv._to_path = fail
+    assert conv.to_path(target, check=False) == join("id1", "name~br1")
+    with pytest.raises(RuntimeError):
+        conv.to_path(target)
+
+    conv = TargetToPathExpr()
+    conv.check_threshold = 1
+    with pytest.raises(ValueError):
+        conv.from_path(join("id1", "name~br1.br1"))
+    conv.from_path(join("id1", "name~br1.br1"))
+    conv.check_threshold = None
+    with pytest.raises(ValueError):
+        conv.from_path(join("id1", "name~br1.br1"))